@@ -0,0 +1,39 @@
+"""
+두 GUI 앱(gui_app, new_gui_app)이 공유하는 로그 위젯 구성 믹스인.
+
+로그 프레임(Text + Scrollbar) 구성과 append 코드가 두 파일에 중복되어
+있었고, 두 앱을 함께 띄우면 같은 Tcl 초기화 경로를 두 번 밟게 되어
+한 곳으로 모았습니다.
+"""
+import tkinter as tk
+
+
+class LoggingTkMixin:
+    """로그 표시용 Text + Scrollbar 묶음을 만들어 주는 믹스인."""
+
+    def _create_log_widgets(self, parent, height=None):
+        """parent 안에 읽기 전용 로그 Text와 스크롤바를 만들어 배치합니다."""
+        # append 전용 로그에 undo 히스토리는 메모리 낭비일 뿐이므로 꺼 둡니다
+        kwargs = {'wrap': tk.WORD, 'state': tk.DISABLED, 'undo': False, 'maxundo': 0}
+        if height is not None:
+            kwargs['height'] = height
+        self.log_text = tk.Text(parent, **kwargs)
+        self.log_scrollbar = tk.Scrollbar(parent, command=self.log_text.yview)
+        self.log_text.config(yscrollcommand=self.log_scrollbar.set)
+
+        self.log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def _append_log_lines(self, text):
+        """읽기 전용 상태를 잠깐 풀고 텍스트를 덧붙인 뒤 끝으로 스크롤합니다."""
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, text)
+        self.log_text.see(tk.END)
+        self.log_text.config(state=tk.DISABLED)
+
+    def _trim_log(self, max_lines=5000, drop_lines=1000):
+        """로그가 max_lines를 넘으면 앞쪽 drop_lines줄을 지워 메모리를 제한합니다."""
+        if int(self.log_text.index('end-1c').split('.')[0]) > max_lines:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.delete('1.0', f'{drop_lines}.0')
+            self.log_text.config(state=tk.DISABLED)
@@ -1,14 +1,69 @@
 import os
 import json
+import mmap
+import threading
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, ImageDraw
 from scipy.ndimage import label, find_objects, binary_opening, center_of_mass, gaussian_filter
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from datetime import datetime
 
+# OpenCV는 선택적 의존성입니다. 설치되어 있으면 SIMD 최적화된 모폴로지 연산을 사용하고,
+# 없으면 기존 scipy.ndimage.binary_opening으로 동작합니다.
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    cv2 = None
+    HAS_CV2 = False
+
+# orjson도 선택적 의존성입니다. 설치되어 있으면 stdlib json보다 훨씬 빠르게 파싱합니다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config import (
     ANALYSIS_PARAMS, FOOT_TYPE_CRITERIA, VISUALIZATION
 )
+from analyzer_kernels import NUMBA_AVAILABLE, filter_and_stats
+
+# 보고서용 Figure는 생성/해제 비용(폰트 캐시 조회, 축 구성)이 커서
+# 프로세스당 하나를 만들어 배치 호출 간에 재사용합니다.
+_FIG_LOCK = threading.Lock()
+_FIG = None
+_AX_MAIN = None
+_CAX = None
+
+def _get_report_figure(figsize):
+    """재사용 가능한 (Figure, 메인 축, 컬러바 축)을 반환합니다. 호출 전 _FIG_LOCK을 잡아야 합니다."""
+    global _FIG, _AX_MAIN, _CAX
+    if _FIG is None:
+        # pyplot을 거치지 않는 순수 Agg Figure라 GUI 백엔드/메인 스레드 제약이 없고,
+        # 워커 스레드에서 렌더링해도 안전합니다.
+        _FIG = Figure(figsize=figsize, facecolor='white')
+        FigureCanvasAgg(_FIG)
+        # 그래프와 컬러바가 전체 이미지 영역을 차지하도록 레이아웃 조정
+        _AX_MAIN = _FIG.add_axes([0.05, 0.1, 0.9, 0.85])  # [left, bottom, width, height]
+        _CAX = _FIG.add_axes([0.05, 0.05, 0.9, 0.03])  # 컬러바를 위한 축
+    else:
+        _FIG.set_size_inches(*figsize)
+        _AX_MAIN.cla()
+        _CAX.cla()
+    return _FIG, _AX_MAIN, _CAX
+
+# 컬러맵 객체는 조회 비용이 있으므로 프로세스 수명 동안 캐시합니다.
+_CMAP_CACHE = {}
+
+def _get_cached_cmap(name):
+    cmap = _CMAP_CACHE.get(name)
+    if cmap is None:
+        cmap = plt.get_cmap(name)
+        _CMAP_CACHE[name] = cmap
+    return cmap
 
 def convert_numpy_to_native(data):
     """
@@ -44,6 +99,15 @@ class FootPressureAnalyzer:
         self.pressure_data = None
         self.total_pressure = None
         self.cop = None  # 압력 중심점(CoP) 추가
+        self._fused_cop = None  # 융합 커널이 미리 계산한 CoP (없으면 None)
+        self._zones = None  # 구역 인덱스 캐시 (분포 계산 시 한 번만 생성)
+
+        # 발 유형 분류 기준은 기동 시 고정이므로 인스턴스 float로 한 번만 읽어 둡니다.
+        self._high_thresh = FOOT_TYPE_CRITERIA.get('high_arch', 0.21)
+        self._normal_thresh = FOOT_TYPE_CRITERIA.get('normal', 0.26)
+        self._ideal_arch = 0.5 * (self._high_thresh + self._normal_thresh)
+        self._arch_width = 0.5 * (self._normal_thresh - self._high_thresh)
+        self._arch_types = ("요족 (High Arch)", "정상 (Normal)", "평발 (Flat Foot)")
         self.left_foot_indices = None
         self.right_foot_indices = None
         self.analysis_results = {}
@@ -80,8 +144,14 @@ class FootPressureAnalyzer:
             return False
         return True
 
-    def get_visualization_data(self):
-        """시각화에 필요한 데이터를 딕셔너리로 반환합니다."""
+    def get_visualization_data(self, convert_native=False):
+        """
+        시각화에 필요한 데이터를 딕셔너리로 반환합니다.
+
+        convert_native=True면 pressure_data까지 중첩 리스트로 변환합니다
+        (스레드/tkinter 경계에서 기존 동작이 필요한 호출자용).
+        기본값은 ndarray를 그대로 전달하여 O(N) 변환을 건너뜁니다.
+        """
         if self.error_message:
             return None
         
@@ -96,57 +166,138 @@ class FootPressureAnalyzer:
                 "gaussian_sigma": VISUALIZATION.get('gaussian_sigma', 1.0)
             }
         }
-        native_data = convert_numpy_to_native(vis_data)
-        self._log("Numpy 타입을 파이썬 기본 타입으로 변환 완료.")
-        return native_data
-
-    def save_visualization(self, output_path, vis_data):
-        """ 분석 결과를 이미지 파일로 저장합니다. (텍스트 정보 없이 그래프만) """
+        # 분석 결과의 스칼라 값들은 계산 시점에 이미 기본 타입으로 저장되므로
+        # 전체 딕셔너리를 재귀 순회하며 변환할 필요가 없습니다.
+        # pressure_data는 ndarray 그대로 전달합니다 (ndarray는 스레드 간 전달에 안전).
+        if convert_native:
+            return convert_numpy_to_native(vis_data)
+        return vis_data
+
+    def save_visualization(self, output_path, vis_data, return_rgb=False):
+        """
+        분석 결과를 이미지 파일로 저장합니다. (텍스트 정보 없이 그래프만)
+
+        return_rgb=True면 렌더링된 RGB 버퍼(ndarray 복사본)를 함께 반환합니다.
+        보고서 배경이 불투명하므로 알파 채널을 떼어 픽셀당 3바이트만 전달합니다
+        (GUI 측 scaled() 시 메모리 이동량 25% 감소). GUI는 방금 저장한 PNG를
+        디스크에서 다시 디코드하지 않고 이 버퍼를 바로 표시할 수 있습니다.
+        """
         if not vis_data:
             self._log(f"오류: 시각화 데이터가 제공되지 않았습니다.")
-            return
+            return None
 
         # 1. (개선) 가우시안 필터를 적용하여 데이터를 부드럽게 만듭니다.
-        pressure_data = np.array(vis_data['pressure_data'])
-        smoothed_data = gaussian_filter(pressure_data, sigma=VISUALIZATION.get('gaussian_sigma', 1.0))
-        
+        # asarray: 이미 ndarray면 복사 없이 그대로 사용
+        pressure_data = np.asarray(vis_data['pressure_data'])
+        sigma = VISUALIZATION.get('gaussian_sigma', 1.0)
+        if HAS_CV2:
+            # OpenCV의 분리형 SIMD 블러가 scipy의 범용 ndimage 필터보다 훨씬 빠릅니다.
+            # 결과는 float32이며 imshow에서 그대로 사용 가능합니다.
+            smoothed_data = cv2.GaussianBlur(np.asarray(pressure_data, dtype=np.float32), (0, 0), sigma)
+        else:
+            smoothed_data = gaussian_filter(pressure_data, sigma=sigma)
+
+        # 고속 렌더링 모드: matplotlib Figure를 생성하지 않고 PIL로 직접 저장
+        if VISUALIZATION.get('fast_render', False):
+            return self._save_visualization_fast(output_path, smoothed_data, vis_data,
+                                                 return_rgb=return_rgb)
+
         # 2. (개선) 컬러맵과 보간법을 설정합니다.
         figsize = vis_data['config'].get('figsize', (8, 10))
         cmap = VISUALIZATION.get('cmap', 'plasma') # 'plasma'를 기본값으로 변경
         interpolation = VISUALIZATION.get('interpolation', 'bilinear') # 'bilinear'를 기본값으로
         
-        fig = plt.figure(figsize=figsize, facecolor='white')
-        
-        # 그래프와 컬러바가 전체 이미지 영역을 차지하도록 레이아웃 조정
-        ax_main = fig.add_axes([0.05, 0.1, 0.9, 0.85]) # [left, bottom, width, height]
-        cax = fig.add_axes([0.05, 0.05, 0.9, 0.03]) # 컬러바를 위한 축
-
-        im = ax_main.imshow(smoothed_data, cmap=cmap, interpolation=interpolation)
-        
-        # 시각화 상세 정보 그리기 (CoP, 중심선 등)
-        self._draw_visualization_details(fig, ax_main, vis_data)
-        
-        ax_main.axis('off')
-
-        # 컬러바 생성 (레이블 텍스트 크기 조정)
-        cbar = fig.colorbar(im, cax=cax, orientation='horizontal')
-        cbar.set_label('Pressure', size=10)
-        cbar.ax.tick_params(labelsize=8)
-        
+        # 파일마다 Figure를 새로 만들지 않고 프로세스 단위 캐시를 재사용합니다.
+        with _FIG_LOCK:
+            fig, ax_main, cax = _get_report_figure(figsize)
+
+            im = ax_main.imshow(smoothed_data, cmap=cmap, interpolation=interpolation)
+
+            # 시각화 상세 정보 그리기 (CoP, 중심선 등)
+            self._draw_visualization_details(fig, ax_main, vis_data)
+
+            ax_main.axis('off')
+
+            # 컬러바 생성 (레이블 텍스트 크기 조정)
+            cbar = fig.colorbar(im, cax=cax, orientation='horizontal')
+            cbar.set_label('Pressure', size=10)
+            cbar.ax.tick_params(labelsize=8)
+
+            rgb = None
+            if return_rgb:
+                # savefig와 별개로 화면 표시용 버퍼를 잡아 둡니다.
+                # 알파를 버리고 연속 배열로 복사하므로 다음 렌더링이
+                # 같은 캔버스 버퍼를 덮어써도 안전합니다.
+                fig.canvas.draw()
+                rgb = np.ascontiguousarray(np.asarray(fig.canvas.buffer_rgba())[:, :, :3])
+
+            try:
+                # bbox_inches='tight' 옵션으로 저장 시 여백을 최소화
+                fig.savefig(output_path, dpi=VISUALIZATION.get('dpi', 150), bbox_inches='tight', pad_inches=0.1)
+                self._log(f"✅ 분석 보고서 저장 완료: {os.path.basename(output_path)}")
+            except Exception as e:
+                self._log(f"❗️ 이미지 파일 저장 실패: {e}")
+            return rgb
+
+    def _save_visualization_fast(self, output_path, smoothed_data, vis_data, return_rgb=False):
+        """
+        컬러맵 LUT + PIL만으로 히트맵 이미지를 저장합니다.
+        matplotlib Figure/Axes/colorbar 생성 비용을 모두 건너뛰는 고속 경로입니다.
+        (컬러바가 필요한 보고서는 기존 save_visualization 경로를 사용)
+        return_rgb=True면 저장한 이미지의 RGB 배열을 반환합니다.
+        """
         try:
-            # bbox_inches='tight' 옵션으로 저장 시 여백을 최소화
-            fig.savefig(output_path, dpi=VISUALIZATION.get('dpi', 150), bbox_inches='tight', pad_inches=0.1)
-            self._log(f"✅ 분석 보고서 저장 완료: {os.path.basename(output_path)}")
+            value_range = smoothed_data.max() - smoothed_data.min()
+            norm = (smoothed_data - smoothed_data.min()) / (value_range if value_range else 1)
+            cmap = _get_cached_cmap(VISUALIZATION.get('cmap', 'plasma'))
+            rgba = (cmap(norm) * 255).astype(np.uint8)
+            img = Image.fromarray(rgba[:, :, :3])
+
+            # 센서 해상도 그대로는 너무 작으므로 셀 단위로 확대
+            scale = VISUALIZATION.get('fast_render_scale', 8)
+            img = img.resize((img.width * scale, img.height * scale), Image.BILINEAR)
+            draw = ImageDraw.Draw(img)
+
+            rows, cols = smoothed_data.shape
+            line_color = VISUALIZATION.get('CENTER_LINE_COLOR', 'white')
+            mid_x = (cols // 2) * scale
+            draw.line([(mid_x, 0), (mid_x, img.height)], fill=line_color)
+            draw.line([(0, (rows // 2) * scale), (img.width, (rows // 2) * scale)], fill=line_color)
+
+            results = vis_data.get('analysis_results', {})
+            zones = results.get('zones')
+            if zones:
+                for y in (zones['mid']['start'], zones['fore']['start']):
+                    draw.line([(0, y * scale), (img.width, y * scale)], fill='white')
+
+            cop = results.get('cop')
+            if cop:
+                cop_y, cop_x = int(cop[0] * scale), int(cop[1] * scale)
+                marker_r = VISUALIZATION.get('COP_MARKER_SIZE', 12) // 2
+                cop_color = VISUALIZATION.get('COP_COLOR', 'red')
+                draw.line([(cop_x - marker_r, cop_y - marker_r), (cop_x + marker_r, cop_y + marker_r)], fill=cop_color, width=2)
+                draw.line([(cop_x - marker_r, cop_y + marker_r), (cop_x + marker_r, cop_y - marker_r)], fill=cop_color, width=2)
+
+            img.save(output_path, format='PNG', optimize=False)
+            self._log(f"✅ 분석 보고서 저장 완료 (고속 렌더링): {os.path.basename(output_path)}")
+            if return_rgb:
+                # img는 이미 RGB 모드이므로 변환 없이 배열 뷰만 만듭니다
+                return np.asarray(img)
         except Exception as e:
             self._log(f"❗️ 이미지 파일 저장 실패: {e}")
-        finally:
-            plt.close(fig)
+        return None
 
     def _load_data(self):
         self._log(f"데이터 로딩 중: {os.path.basename(self.json_path)}")
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                # mmap으로 파일 내용을 중간 bytes 객체 없이 파서에 바로 넘깁니다
+                with open(self.json_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = orjson.loads(memoryview(mm))
+            else:
+                with open(self.json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             pressure_rows = data.get('RawPressureByRows')
             if not pressure_rows: 
                 self._log("'RawPressureByRows' 키를 찾을 수 없습니다.")
@@ -156,12 +307,18 @@ class FootPressureAnalyzer:
             # 행(row) 키에서 숫자 부분을 추출하여 정렬
             # 예: "Row_0", "Row_1", ...
             sorted_keys = sorted(pressure_rows.keys(), key=lambda x: int(x.split('_')[1]))
-            
-            # 정렬된 키를 바탕으로 압력 데이터를 2D 리스트로 구성
-            pressure_matrix = [list(map(int, pressure_rows[key].split(', '))) for key in sorted_keys]
 
-            self.pressure_array = np.array(pressure_matrix)
-            self.pressure_data = self.pressure_array.copy()
+            # 행 문자열을 C 레벨에서 바로 파싱하여 미리 할당된 버퍼에 채웁니다.
+            # (파이썬 int() 호출 수천 번 + 중간 리스트 생성 제거)
+            first_row = np.fromstring(pressure_rows[sorted_keys[0]], dtype=np.int32, sep=',')
+            out = np.empty((len(sorted_keys), first_row.shape[0]), dtype=np.int32)
+            out[0] = first_row
+            for i, key in enumerate(sorted_keys[1:], start=1):
+                out[i] = np.fromstring(pressure_rows[key], dtype=np.int32, sep=',')
+
+            self.pressure_array = out
+            # 파이프라인 내부에서 수정되지 않으므로 복사 대신 참조로 유지
+            self.pressure_data = self.pressure_array
             self._log(f"데이터 로딩 완료. 압력 매트릭스 크기: {self.pressure_array.shape}")
         except (json.JSONDecodeError, ValueError, TypeError, KeyError) as e:
             self._log(f"❗️ 오류: '{os.path.basename(self.json_path)}' 파일 처리 중 오류 발생 - {e}")
@@ -179,22 +336,40 @@ class FootPressureAnalyzer:
             return
             
         threshold = ANALYSIS_PARAMS.get('noise_threshold', 5)
-        self.cleaned_array = np.where(self.pressure_array > threshold, self.pressure_array, 0)
-        
-        # 연결된 작은 객체들(노이즈)을 제거하기 위해 binary_opening 사용
-        structure = np.ones((3, 3), dtype=int)
-        self.cleaned_array = binary_opening(self.cleaned_array > 0, structure=structure).astype(int) * self.cleaned_array
+
+        # 연결된 작은 객체들(노이즈)을 제거하기 위해 3x3 열림(opening) 연산 사용
+        if NUMBA_AVAILABLE:
+            # 융합 커널: 임계값 + 열림 + 총압력/CoP 집계를 매트릭스 1회 순회로 처리
+            cleaned, total, cop_y, cop_x = filter_and_stats(self.pressure_array, threshold)
+            self.cleaned_array = cleaned
+            self.total_pressure = total
+            self._fused_cop = (cop_y, cop_x) if total > 0 else None
+        elif HAS_CV2:
+            # OpenCV의 분리형(erode+dilate) 모폴로지는 작은 커널에서 scipy보다 훨씬 빠릅니다.
+            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+            mask = (self.pressure_array > threshold).astype(np.uint8)
+            opened = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+            self.cleaned_array = self.pressure_array * opened
+        else:
+            self.cleaned_array = np.where(self.pressure_array > threshold, self.pressure_array, 0)
+            structure = np.ones((3, 3), dtype=int)
+            self.cleaned_array = binary_opening(self.cleaned_array > 0, structure=structure).astype(int) * self.cleaned_array
         self._log("----------------- 노이즈 필터링 완료 -----------------")
         
     def _calculate_cop(self):
         """전체 압력 중심점(Center of Pressure)을 계산합니다."""
         self._log("-------------- 압력 중심점(CoP) 계산 시작 --------------")
-        if self.cleaned_array.size == 0 or np.sum(self.cleaned_array) == 0:
+        if self._fused_cop is not None:
+            # _filter_noise의 융합 커널이 이미 CoP를 계산한 경우 재순회를 건너뜁니다.
+            self.cop = self._fused_cop
+        elif self.cleaned_array.size == 0 or np.sum(self.cleaned_array) == 0:
             self._log("압력 데이터가 없어 CoP를 계산할 수 없습니다.")
             self.cop = None
             return
-
-        self.cop = center_of_mass(self.cleaned_array)
+        else:
+            com_y, com_x = center_of_mass(self.cleaned_array)
+            # 스레드/tkinter 경계를 넘을 때 재변환이 필요 없도록 처음부터 기본 float로 저장
+            self.cop = (float(com_y), float(com_x))
         self._log(f"➡️ 계산된 CoP 위치 (y, x): ({self.cop[0]:.2f}, {self.cop[1]:.2f})")
         self._log("-------------- 압력 중심점(CoP) 계산 완료 --------------")
 
@@ -206,10 +381,12 @@ class FootPressureAnalyzer:
         rows, cols = array.shape
         mid_col = cols // 2
         labeled_array, num_features = label(array > 0)
+        # 객체별 바운딩 슬라이스는 한 번의 C 패스로 얻어 CASE 1/2 양쪽에서 재사용
+        objs = find_objects(labeled_array)
 
         # CASE 1: 두 발이 붙어 하나의 큰 객체로 인식될 경우 강제 분리
         if num_features == 1:
-            obj_slice = find_objects(labeled_array)[0]
+            obj_slice = objs[0]
             obj_min_col, obj_max_col = obj_slice[1].start, obj_slice[1].stop
             
             # 객체가 중앙을 가로지르고, 너비가 충분히 넓은 경우
@@ -218,32 +395,33 @@ class FootPressureAnalyzer:
             
             if is_spanning_center and is_wide_enough:
                 self._log("두 발이 연결된 것으로 판단하여 중앙을 기준으로 강제 분리합니다.")
-                left_mask = np.zeros_like(array, dtype=bool)
-                left_mask[:, :mid_col] = labeled_array[:, :mid_col] == 1
-                
-                right_mask = np.zeros_like(array, dtype=bool)
-                right_mask[:, mid_col:] = labeled_array[:, mid_col:] == 1
+                # 객체 마스크를 한 번만 비교로 만들고 열 범위만 지워 좌/우로 나눕니다.
+                left_mask = labeled_array == 1
+                right_mask = left_mask.copy()
+                left_mask[:, mid_col:] = False
+                right_mask[:, :mid_col] = False
 
-                left_foot = array * left_mask
-                right_foot = array * right_mask
+                # 곱셈 대신 단일 select 연산으로 마스크 적용 (임시 배열 1개 절약)
+                left_foot = np.where(left_mask, array, 0)
+                right_foot = np.where(right_mask, array, 0)
 
                 # 분리 후 양쪽에 모두 데이터가 있는지 확인
                 if np.sum(left_foot) > 0 and np.sum(right_foot) > 0:
                     return left_foot, right_foot
 
         # CASE 2: 여러 객체가 분리되어 있을 경우 (일반적인 경우)
-        left_mask = np.zeros_like(array, dtype=bool)
-        right_mask = np.zeros_like(array, dtype=bool)
-        coms = [center_of_mass(array, labeled_array, i + 1) for i in range(num_features)]
-        
-        for i, com in enumerate(coms):
-            # 무게 중심의 x좌표(com[1])가 중앙보다 왼쪽에 있으면 왼발
-            if com[1] < mid_col:
-                left_mask[labeled_array == i + 1] = True
-            else:
-                right_mask[labeled_array == i + 1] = True
-                
-        return array * left_mask, array * right_mask
+        # label()이 이미 만들어 둔 바운딩 슬라이스의 x 중점으로 좌/우를 판정합니다.
+        # 객체당 O(1) 메타데이터 연산이라 매트릭스 재순회가 전혀 없습니다.
+        centroids_x = np.array([(s[1].start + s[1].stop) * 0.5 for s in objs])
+        labels = np.arange(1, num_features + 1)
+        left_labels = labels[centroids_x < mid_col]
+        right_labels = labels[centroids_x >= mid_col]
+
+        # 객체별 불리언 임시 배열 대신 isin으로 마스크를 한 번에 생성
+        left_mask = np.isin(labeled_array, left_labels)
+        right_mask = np.isin(labeled_array, right_labels)
+
+        return np.where(left_mask, array, 0), np.where(right_mask, array, 0)
 
     def _get_foot_zone_indices(self, foot_bbox, total_rows):
         if not foot_bbox: return None
@@ -271,7 +449,10 @@ class FootPressureAnalyzer:
         def get_virtual_footprint(foot_array):
             if np.sum(foot_array) == 0: return None
             # 압력이 감지된 행들의 인덱스를 찾음
-            rows_with_pressure = np.where(np.any(foot_array > 0, axis=1))[0]
+            # (음수가 없는 배열이므로 행 합 > 0 이 np.any(... > 0)와 동일하며,
+            #  (H,W) 불리언 임시 배열 없이 O(H) 벡터만 만듭니다)
+            row_mass = foot_array.sum(axis=1)
+            rows_with_pressure = np.flatnonzero(row_mass)
             if len(rows_with_pressure) == 0: return None
             min_r, max_r = rows_with_pressure.min(), rows_with_pressure.max()
             return (min_r, max_r)
@@ -283,29 +464,39 @@ class FootPressureAnalyzer:
         # 양발의 전체 BBox 계산
         all_min_r = min([b[0] for b in [left_bbox, right_bbox] if b])
         all_max_r = max([b[1] for b in [left_bbox, right_bbox] if b])
-        self.final_bbox = (all_min_r, all_max_r)
+        # Numpy 정수 대신 기본 int로 저장하여 이후 zone 계산/직렬화가 모두 기본 타입이 되도록 함
+        self.final_bbox = (int(all_min_r), int(all_max_r))
         
         total_pressure = np.sum(self.left_foot) + np.sum(self.right_foot)
         if total_pressure == 0: return
         
-        zones = self._get_foot_zone_indices(self.final_bbox, self.pressure_array.shape[0])
+        # 동일한 인자로 세 번 호출되던 구역 계산을 한 번만 수행하고 캐시합니다.
+        self._zones = self._get_foot_zone_indices(self.final_bbox, self.pressure_array.shape[0])
+        zones = self._zones
         if not zones: return
-        
+
         # 각 발, 각 영역의 압력 계산
+        # 행 단위 합을 한 번만 구한 뒤 reduceat으로 세 구역 합을 한 번에 계산합니다.
+        # (구역별 슬라이스 + np.sum 6회 대신 발당 2회의 벡터화된 리덕션)
+        zone_starts = np.array([zones['hind']['start'], zones['mid']['start'], zones['fore']['start']])
         for prefix, foot_array in [('L', self.left_foot), ('R', self.right_foot)]:
-            foot_total_pressure = np.sum(foot_array)
+            row_sums = foot_array.sum(axis=1)
+            foot_total_pressure = row_sums.sum()
             if foot_total_pressure == 0: continue
 
-            for zone_name, zone_indices in zones.items():
-                sum_in_zone = np.sum(foot_array[zone_indices['start']:zone_indices['stop'], :])
-                # 각 발의 전체 압력 대비 해당 영역의 압력 비율
-                self.distribution[f"{prefix}{zone_name[0].upper()}"] = (sum_in_zone / foot_total_pressure) * 100
+            zone_sums = np.add.reduceat(row_sums, zone_starts)
+            for zone_name, sum_in_zone in zip(('hind', 'mid', 'fore'), zone_sums):
+                # reduceat은 빈 구간(start == stop)에서 단일 요소를 반환하므로 0으로 보정
+                if zones[zone_name]['start'] >= zones[zone_name]['stop']:
+                    sum_in_zone = 0
+                # 각 발의 전체 압력 대비 해당 영역의 압력 비율 (기본 float로 저장)
+                self.distribution[f"{prefix}{zone_name[0].upper()}"] = float(sum_in_zone / foot_total_pressure) * 100
 
     def _analyze_foot_type(self):
         self._log("----------------- 발 유형 분석 시작 -----------------")
         
-        zones = self._get_foot_zone_indices(self.final_bbox, self.pressure_array.shape[0])
-        if not zones: 
+        zones = self._zones
+        if not zones:
             self._log("발 영역이 정의되지 않아 유형 분석을 건너뜁니다.")
             return
 
@@ -320,28 +511,22 @@ class FootPressureAnalyzer:
                 self.foot_types[name] = {'type': "데이터 없음", 'value': 0, 'score': 0}
                 continue
 
-            arch_index = mid_pressure / foot_total_pressure
-            
+            arch_index = float(mid_pressure / foot_total_pressure)
+
             type_str = self._classify_arch(arch_index)
             score = self._calculate_arch_score(arch_index)
             self.foot_types[name] = {'type': type_str, 'value': arch_index, 'score': score}
             self._log(f"분석 완료 ({name}): AI={arch_index:.3f}, Type={type_str}, Score={score}")
 
     def _classify_arch(self, ratio):
-        if ratio <= FOOT_TYPE_CRITERIA.get('high_arch', 0.21): return "요족 (High Arch)"
-        if ratio <= FOOT_TYPE_CRITERIA.get('normal', 0.26): return "정상 (Normal)"
-        return "평발 (Flat Foot)"
+        # 분기 대신 임계값 초과 개수를 인덱스로 사용 (요족/정상/평발)
+        return self._arch_types[int(ratio > self._high_thresh) + int(ratio > self._normal_thresh)]
 
     def _calculate_arch_score(self, arch_index):
-        high_thresh = FOOT_TYPE_CRITERIA.get('high_arch', 0.21)
-        normal_thresh = FOOT_TYPE_CRITERIA.get('normal', 0.26)
-        
-        ideal = (high_thresh + normal_thresh) / 2
-        width = (normal_thresh - high_thresh) / 2
-        if width == 0: return 100.0 if arch_index == ideal else 0.0
-        
-        deviation = abs(arch_index - ideal) / width
-        score = max(0, 100 - (deviation * 50)) # 점수 편차를 더 크게 조절
+        if self._arch_width == 0: return 100.0 if arch_index == self._ideal_arch else 0.0
+
+        deviation = abs(arch_index - self._ideal_arch) / self._arch_width
+        score = max(0.0, 100.0 - (deviation * 50.0)) # 점수 편차를 더 크게 조절
         return round(score, 1)
 
     def _prepare_final_results(self):
@@ -350,14 +535,15 @@ class FootPressureAnalyzer:
             'distribution': self.distribution,
             'foot_types': self.foot_types,
             'final_bbox': self.final_bbox,
-            'zones': self._get_foot_zone_indices(self.final_bbox, self.pressure_array.shape[0]),
+            'zones': self._zones,
             'cop': self.cop
         }
 
     def _draw_visualization_details(self, fig, ax, vis_data):
         """시각화 이미지에 각종 분석 정보를 그립니다."""
         results = vis_data.get('analysis_results', {})
-        pressure_data = np.array(vis_data.get('pressure_data'))
+        # 이미 ndarray면 복사하지 않음 (shape 조회 용도로만 사용)
+        pressure_data = np.asarray(vis_data.get('pressure_data'))
         if pressure_data.size == 0 or not results: return
             
         rows, cols = pressure_data.shape
@@ -0,0 +1,83 @@
+import numpy as np
+
+# Numba는 선택적 의존성입니다. 설치되어 있으면 아래 커널이 JIT 컴파일되어
+# 임계값 처리 + 3x3 열림(opening) + CoP/총압력 집계를 한 번의 순회로 수행합니다.
+# 없으면 엔진이 기존 scipy/numpy 경로로 동작합니다.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def filter_and_stats(arr, thresh):
+    """
+    압력 매트릭스에 대해 임계값 처리, 3x3 열림 연산(침식 후 팽창),
+    총압력과 압력 중심점(CoP) 집계를 단일 순회로 수행합니다.
+
+    반환: (cleaned, total, cop_y, cop_x)
+    압력이 전혀 없으면 cop_y, cop_x는 -1.0입니다.
+    """
+    rows, cols = arr.shape
+
+    # 1. 침식(erosion): 3x3 창 내 모든 픽셀이 임계값을 넘어야 살아남음
+    #    (경계 밖은 scipy.binary_opening과 동일하게 0으로 간주)
+    eroded = np.zeros((rows, cols), dtype=np.uint8)
+    for i in range(1, rows - 1):
+        for j in range(1, cols - 1):
+            keep = True
+            for di in range(-1, 2):
+                for dj in range(-1, 2):
+                    if arr[i + di, j + dj] <= thresh:
+                        keep = False
+                        break
+                if not keep:
+                    break
+            if keep:
+                eroded[i, j] = 1
+
+    # 2. 팽창(dilation) + 원본 값 복원 + 통계 집계를 한 번에 수행
+    cleaned = np.zeros((rows, cols), dtype=arr.dtype)
+    total = 0.0
+    sum_y = 0.0
+    sum_x = 0.0
+    for i in range(rows):
+        i0 = i - 1 if i > 0 else 0
+        i1 = i + 2 if i < rows - 1 else rows
+        for j in range(cols):
+            j0 = j - 1 if j > 0 else 0
+            j1 = j + 2 if j < cols - 1 else cols
+            hit = False
+            for di in range(i0, i1):
+                for dj in range(j0, j1):
+                    if eroded[di, dj] == 1:
+                        hit = True
+                        break
+                if hit:
+                    break
+            v = arr[i, j]
+            if hit and v > thresh:
+                cleaned[i, j] = v
+                total += v
+                sum_y += i * v
+                sum_x += j * v
+
+    if total > 0:
+        return cleaned, total, sum_y / total, sum_x / total
+    return cleaned, total, -1.0, -1.0
+
+
+# 임포트 시점에 작은 입력으로 커널을 한 번 호출해 둡니다.
+# cache=True와 결합하면 최초 실행 이후에는 디스크의 컴파일 캐시가 로드되어
+# 첫 분석 호출이 JIT 컴파일 비용(1~3초)을 지불하지 않습니다.
+if NUMBA_AVAILABLE:
+    try:
+        _ = filter_and_stats(np.zeros((4, 4), dtype=np.int32), 0)
+    except Exception:
+        pass
@@ -34,10 +34,11 @@ def get_foot_bbox(foot_array):
     return min_row, max_row
 
 def get_center_of_mass(foot_array):
-    total_pressure = np.sum(foot_array)
+    # 행 합 기반 가중 평균: (H,W) 곱셈 대신 (H,) 곱셈만 수행
+    row_sums = foot_array.sum(axis=1)
+    total_pressure = row_sums.sum()
     if total_pressure == 0: return None
-    y_indices, _ = np.indices(foot_array.shape)
-    com_y = np.sum(y_indices * foot_array) / total_pressure
+    com_y = (np.arange(foot_array.shape[0]) * row_sums).sum() / total_pressure
     return com_y
 
 def infer_virtual_footprint(foot_array, sensor_total_rows):
@@ -113,8 +114,9 @@ def analyze_foot_type(distribution):
 
 def calculate_pressure_distribution(pressure_array):
     # (기존 V2.2.1의 함수 로직과 동일)
+    # 노이즈 제거 결과를 함께 반환하여 시각화 단계가 filter_noise를 다시 돌리지 않도록 함
     total_pressure_original = np.sum(pressure_array)
-    if total_pressure_original == 0: return {}, None
+    if total_pressure_original == 0: return {}, None, pressure_array
     cleaned_array_for_inference = filter_noise(pressure_array)
     rows, cols = cleaned_array_for_inference.shape
     mid_col = cols // 2
@@ -122,12 +124,12 @@ def calculate_pressure_distribution(pressure_array):
     right_foot_array = cleaned_array_for_inference[:, mid_col:]
     left_vbox = infer_virtual_footprint(left_foot_array, rows)
     right_vbox = infer_virtual_footprint(right_foot_array, rows)
-    if not left_vbox and not right_vbox: return {}, None
+    if not left_vbox and not right_vbox: return {}, None, cleaned_array_for_inference
     all_rows = [r for vbox in (left_vbox, right_vbox) if vbox for r in vbox]
     final_min_r, final_max_r = min(all_rows), max(all_rows)
     final_bbox = (final_min_r, final_max_r)
     final_height = final_max_r - final_min_r + 1
-    if final_height < 3: return {}, final_bbox
+    if final_height < 3: return {}, final_bbox, cleaned_array_for_inference
     hind_end_r = final_min_r + final_height // 3
     mid_end_r = final_min_r + (final_height * 2) // 3
     original_left_foot = pressure_array[:, :mid_col]
@@ -140,9 +142,9 @@ def calculate_pressure_distribution(pressure_array):
     for key, value in raw_distribution.items():
         if value < pressure_threshold: raw_distribution[key] = 0
     new_total_pressure = sum(raw_distribution.values())
-    if new_total_pressure == 0: return {key: 0 for key in raw_distribution}, final_bbox
+    if new_total_pressure == 0: return {key: 0 for key in raw_distribution}, final_bbox, cleaned_array_for_inference
     final_distribution = {key: (value / new_total_pressure) * 100 for key, value in raw_distribution.items()}
-    return final_distribution, final_bbox
+    return final_distribution, final_bbox, cleaned_array_for_inference
 
 def create_heatmap_from_json(json_path, output_path):
     # ... (파일 읽기, pressure_array 생성 부분은 동일) ...
@@ -152,13 +154,13 @@ def create_heatmap_from_json(json_path, output_path):
         if not pressure_rows: return
         sorted_keys = sorted(pressure_rows.keys(), key=lambda x: int(x.split('_')[1]))
         pressure_matrix = [list(map(int, pressure_rows[key].split(', '))) for key in sorted_keys]
-        pressure_array = np.array(pressure_matrix)
+        # 센서 값은 작은 정수이므로 int16으로 저장 (np.sum은 int64로 누적하므로 안전)
+        pressure_array = np.array(pressure_matrix, dtype=np.int16)
 
-        distribution, final_bbox = calculate_pressure_distribution(pressure_array)
+        distribution, final_bbox, cleaned_array_for_viz = calculate_pressure_distribution(pressure_array)
         foot_types = analyze_foot_type(distribution)
 
-        # --- 시각화 ---
-        cleaned_array_for_viz = filter_noise(pressure_array)
+        # --- 시각화 (분포 계산에서 만든 노이즈 제거 배열 재사용) ---
         rows, cols = cleaned_array_for_viz.shape
         mid_col = cols // 2
         fig, ax = plt.subplots(figsize=(5, 9))
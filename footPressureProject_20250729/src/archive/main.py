@@ -1,37 +1,196 @@
+import functools
 import json
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 워커 프로세스에서 GUI 백엔드 초기화를 막기 위해 pyplot보다 먼저 지정
 import matplotlib.pyplot as plt
 import os
 import glob
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import matplotlib.font_manager as fm
-from scipy.ndimage import binary_opening # 노이즈 제거를 위해 임포트
+from scipy.ndimage import binary_erosion, binary_dilation, iterate_structure # 노이즈 제거를 위해 임포트
+from scipy.signal import fftconvolve
+from PIL import Image, ImageDraw, ImageFont
+
+# orjson은 선택 설치 - 있으면 stdlib json보다 3~5배 빠르게 파싱합니다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# True면 matplotlib 파이프라인 대신 PIL로 직접 PNG를 씁니다.
+# (Figure/Axes/tight_layout/Agg 비용을 모두 건너뛰는 배치용 고속 경로)
+FAST_RENDER = False
+FAST_RENDER_SCALE = 8
 
 # --- 한글 폰트 설정 ---
 try:
     font_path = '/System/Library/Fonts/AppleSDGothicNeo.ttc'
     font_prop = fm.FontProperties(fname=font_path)
+    # 폰트를 fontManager에 등록해 두면 text 호출마다 파일 경로를 재해석하지 않습니다.
+    fm.fontManager.addfont(font_path)
     plt.rcParams['font.family'] = font_prop.get_name()
     plt.rcParams['axes.unicode_minus'] = False
 except FileNotFoundError:
     print("⚠️ 경고: Apple SD Gothic Neo 폰트를 찾을 수 없습니다. 텍스트가 깨질 수 있습니다.")
     font_prop = None # 폰트가 없으면 None으로 설정
 
+# PIL 고속 렌더용 폰트 (프로세스당 한 번만 로드)
+try:
+    _PIL_FONT = ImageFont.truetype(font_path, 12)
+except OSError:
+    _PIL_FONT = ImageFont.load_default()
+
+# --- 재사용 시각화 리소스 ---
+# 파일마다 plt.subplots/close를 반복하면 Figure 생성·해제 비용이 누적되므로
+# 프로세스당 하나의 Figure/Axes를 만들어 clear 후 재사용합니다.
+_FIG = None
+_AX = None
+_CMAP_JET = plt.get_cmap('jet')
+
+def _get_figure():
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=(4, 8))
+    return _FIG, _AX
+
+def _save_heatmap_fast(output_path, cleaned_array, distribution, global_bbox):
+    """
+    컬러맵 LUT + PIL만으로 히트맵 PNG를 저장합니다.
+    Figure/Axes/tight_layout/Agg 렌더링을 모두 건너뛰는 고속 경로입니다.
+    """
+    value_max = cleaned_array.max()
+    norm = cleaned_array / (value_max if value_max else 1)
+    rgba = (_CMAP_JET(norm) * 255).astype(np.uint8)
+    img = Image.fromarray(rgba[:, :, :3])
+
+    # 센서 해상도 그대로는 너무 작으므로 셀 단위로 확대
+    scale = FAST_RENDER_SCALE
+    img = img.resize((img.width * scale, img.height * scale), Image.BILINEAR)
+    draw = ImageDraw.Draw(img)
+
+    rows, cols = cleaned_array.shape
+    if global_bbox:
+        min_r, max_r = global_bbox
+        global_height = max_r - min_r + 1
+        if global_height >= 3:
+            hind_end_r, mid_end_r = _region_boundaries(min_r, max_r)
+            for r in (hind_end_r, mid_end_r):
+                draw.line([(0, r * scale), (img.width, r * scale)], fill='white')
+
+    if distribution:
+        mid_col = cols // 2
+        text_y_center = rows / 2
+        text_x_left = mid_col / 2
+        text_x_right = mid_col + (mid_col / 2)
+        labels = [
+            (text_x_left, text_y_center - (rows * 0.25), f"뒤: {distribution.get('LH', 0):.1f}%"),
+            (text_x_left, text_y_center, f"중간: {distribution.get('LM', 0):.1f}%"),
+            (text_x_left, text_y_center + (rows * 0.25), f"앞: {distribution.get('LF', 0):.1f}%"),
+            (text_x_right, text_y_center - (rows * 0.25), f"뒤: {distribution.get('RH', 0):.1f}%"),
+            (text_x_right, text_y_center, f"중간: {distribution.get('RM', 0):.1f}%"),
+            (text_x_right, text_y_center + (rows * 0.25), f"앞: {distribution.get('RF', 0):.1f}%"),
+        ]
+        for x, y, text in labels:
+            draw.text((x * scale, y * scale), text, fill='white', font=_PIL_FONT, anchor='mm')
+
+    img.save(output_path)
+
+# 기본 min_size(=3)용 구조 요소는 호출마다 다시 만들지 않도록 모듈 스코프에 둡니다.
+_OPEN_STRUCT = np.ones((2, 2), dtype=bool)
+_OPEN_STRUCT_MERGED = iterate_structure(_OPEN_STRUCT, 3)
+
+# 배치 실행에서 센서 geometry가 파일마다 동일하므로 중간 버퍼를 프로세스 단위로 재사용합니다.
+_BUF = {'mask': None, 'cleaned': None}
+
 # --- 분석 함수 ---
 
+def _opening_fft(binary_mask, structure):
+    """큰 구조 요소용 FFT 기반 열림(erosion 후 dilation) 연산."""
+    area = structure.sum()
+    eroded = fftconvolve(binary_mask.astype(np.float64), structure, mode='same') > area - 0.1
+    return fftconvolve(eroded.astype(np.float64), structure, mode='same') > 0.1
+
 def filter_noise(pressure_array, min_size=3):
     """
     압력 배열에서 지정된 크기(min_size)보다 작은 연결된 점들을 노이즈로 간주하고 제거합니다.
+    반환 배열은 프로세스 단위로 재사용되는 버퍼이므로 다음 호출 전까지만 유효합니다.
     """
-    # 압력이 0보다 큰 영역에 대한 바이너리 마스크 생성
-    binary_mask = pressure_array > 0
-    
-    # binary_opening 연산을 통해 min_size보다 작은 점들을 제거
-    # structure=np.ones((2,2))는 2x2 이웃을 연결된 것으로 간주
-    cleaned_mask = binary_opening(binary_mask, structure=np.ones((2,2)), iterations=min_size)
-    
-    # 원본 배열에 클리닝된 마스크를 적용하여 노이즈가 제거된 배열 반환
-    return pressure_array * cleaned_mask
+    # 압력이 0보다 큰 영역에 대한 바이너리 마스크 생성 (재사용 버퍼에 기록)
+    binary_mask = _BUF['mask']
+    if binary_mask is None or binary_mask.shape != pressure_array.shape \
+            or _BUF['cleaned'].dtype != pressure_array.dtype:
+        _BUF['mask'] = binary_mask = np.empty(pressure_array.shape, dtype=bool)
+        _BUF['cleaned'] = np.empty_like(pressure_array)
+    np.greater(pressure_array, 0, out=binary_mask)
+
+    # iterations=min_size 만큼 opening을 반복하는 대신, 반복을 병합한 구조 요소로
+    # 침식+팽창을 한 번씩만 수행합니다 (결과 동일, 모폴로지 패스 1/min_size로 감소).
+    structure = _OPEN_STRUCT_MERGED if min_size == 3 else iterate_structure(_OPEN_STRUCT, min_size)
+    if structure.sum() <= 100:
+        cleaned_mask = binary_dilation(binary_erosion(binary_mask, structure=structure), structure=structure)
+    else:
+        # 구조 요소가 크면 직접 모폴로지보다 FFT 경로가 빠릅니다.
+        cleaned_mask = _opening_fft(binary_mask, structure)
+
+    # 전체 곱셈 대신 제거된 픽셀만 0으로 덮어씁니다
+    # (노이즈는 희소하므로 마스크드 스토어가 캐시 친화적)
+    cleaned = _BUF['cleaned']
+    np.copyto(cleaned, pressure_array)
+    np.logical_not(cleaned_mask, out=cleaned_mask)
+    cleaned[cleaned_mask] = 0
+    return cleaned
+
+@functools.lru_cache(maxsize=8)
+def _row_keys(n):
+    """센서 행 수 n에 대한 "Row_0".."Row_{n-1}" 키 목록 (레이아웃별로 한 번만 생성)."""
+    return [f"Row_{i}" for i in range(n)]
+
+def _sorted_row_keys(pressure_rows):
+    """
+    키가 표준 Row_0..Row_{N-1} 패턴이면 정렬 없이 생성된 목록을 반환합니다.
+    (파일마다 N번의 문자열 분해 + 정렬을 멤버십 확인으로 대체)
+    """
+    keys = _row_keys(len(pressure_rows))
+    if all(k in pressure_rows for k in keys):
+        return keys
+    # 비표준 키 패턴이면 기존 정렬 경로로 폴백
+    return sorted(pressure_rows.keys(), key=lambda x: int(x[4:]))
+
+@functools.lru_cache(maxsize=128)
+def _load_pressure_array_cached(json_path, mtime):
+    """(경로, 수정 시각)을 키로 파싱 결과를 캐시합니다. mtime은 캐시 무효화용입니다."""
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    pressure_rows = data.get('RawPressureByRows')
+    if not pressure_rows:
+        return None
+
+    sorted_keys = _sorted_row_keys(pressure_rows)
+
+    # 파이썬 int() 루프 대신 행 문자열을 C 레벨에서 바로 파싱해 버퍼를 채웁니다.
+    # 센서 값은 작은 정수이므로 int16으로 저장해 캐시/대역폭 사용량을 절반으로 줄입니다.
+    # (np.sum은 int16을 자동으로 int64로 누적하므로 오버플로 걱정 없음)
+    first_row = np.fromstring(pressure_rows[sorted_keys[0]], dtype=np.int16, sep=',')
+    out = np.empty((len(sorted_keys), first_row.shape[0]), dtype=np.int16)
+    out[0] = first_row
+    for i, key in enumerate(sorted_keys[1:], start=1):
+        out[i] = np.fromstring(pressure_rows[key], dtype=np.int16, sep=',')
+    return out
+
+def load_pressure_array(json_path):
+    """
+    JSON 파일에서 압력 매트릭스를 읽어 반환합니다.
+    같은 파일을 다시 요청하면 재파싱 없이 캐시에서 가져옵니다.
+    """
+    return _load_pressure_array_cached(json_path, os.path.getmtime(json_path))
 
 def get_foot_bbox(foot_array):
     """
@@ -45,10 +204,17 @@ def get_foot_bbox(foot_array):
     max_row, _ = coords.max(axis=0)
     return min_row, max_row
 
-def calculate_pressure_distribution(pressure_array):
+@functools.lru_cache(maxsize=256)
+def _region_boundaries(min_r, max_r):
+    """통합 bbox의 1/3, 2/3 경계 행을 반환합니다 (bbox별로 한 번만 계산)."""
+    height = max_r - min_r + 1
+    return min_r + height // 3, min_r + (height * 2) // 3
+
+def calculate_pressure_distribution(pressure_array, cleaned_array=None, global_bbox=None):
     """
     노이즈가 제거된 전체 압력 배열로부터 6개 구역의 압력 분포를 계산합니다.
     양발을 아우르는 통합 Bounding Box를 기준으로 영역을 대칭적으로 나눕니다.
+    호출자가 이미 계산한 cleaned_array/global_bbox를 넘기면 재계산하지 않습니다.
     """
     # 1. 노이즈 제거 전처리
     # (주의: 분포 계산은 원본(노이즈 제거 전) 데이터로 수행하여 실제 값 반영)
@@ -56,10 +222,12 @@ def calculate_pressure_distribution(pressure_array):
     if total_pressure_original == 0:
         return {}
 
-    cleaned_array_for_bbox = filter_noise(pressure_array)
-    
+    if cleaned_array is None:
+        cleaned_array = filter_noise(pressure_array)
+
     # 2. 통합 Bounding Box 계산
-    global_bbox = get_foot_bbox(cleaned_array_for_bbox)
+    if global_bbox is None:
+        global_bbox = get_foot_bbox(cleaned_array)
     if not global_bbox:
         return {}
         
@@ -70,24 +238,21 @@ def calculate_pressure_distribution(pressure_array):
         return {}
 
     # 3. 통합 기준선 계산
-    hind_end_r = min_r + global_height // 3
-    mid_end_r = min_r + (global_height * 2) // 3
+    hind_end_r, mid_end_r = _region_boundaries(min_r, max_r)
 
     # 4. 각 구역별 압력 계산 (계산은 원본 배열 사용)
+    # 발별 행 합을 한 번만 구하고 reduceat으로 세 구역 합을 한꺼번에 얻습니다.
+    # (픽셀을 여섯 번 읽는 대신 좌/우 한 번씩만 읽음)
     rows, cols = pressure_array.shape
     mid_col = cols // 2
-    
-    left_foot_array = pressure_array[:, :mid_col]
-    right_foot_array = pressure_array[:, mid_col:]
-
-    distribution = {
-        'LH': np.sum(left_foot_array[min_r:hind_end_r, :]),
-        'LM': np.sum(left_foot_array[hind_end_r:mid_end_r, :]),
-        'LF': np.sum(left_foot_array[mid_end_r:max_r + 1, :]),
-        'RH': np.sum(right_foot_array[min_r:hind_end_r, :]),
-        'RM': np.sum(right_foot_array[hind_end_r:mid_end_r, :]),
-        'RF': np.sum(right_foot_array[mid_end_r:max_r + 1, :]),
-    }
+
+    left_row_sums = pressure_array[min_r:max_r + 1, :mid_col].sum(axis=1)
+    right_row_sums = pressure_array[min_r:max_r + 1, mid_col:].sum(axis=1)
+    zone_offsets = np.array([0, hind_end_r - min_r, mid_end_r - min_r])
+
+    lh, lm, lf = np.add.reduceat(left_row_sums, zone_offsets)
+    rh, rm, rf = np.add.reduceat(right_row_sums, zone_offsets)
+    distribution = {'LH': lh, 'LM': lm, 'LF': lf, 'RH': rh, 'RM': rm, 'RF': rf}
 
     # 5. 백분율로 변환
     for key in distribution:
@@ -96,57 +261,64 @@ def calculate_pressure_distribution(pressure_array):
     return distribution
 
 
-def create_heatmap_from_json(json_path, output_path):
+def create_heatmap_from_json(json_path, output_path, render=True):
     """
     JSON 파일을 읽어 노이즈가 제거된 히트맵을 생성하고, 압력 분포와 영역 구분선을 표시합니다.
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        pressure_rows = data.get('RawPressureByRows')
-        if not pressure_rows:
+        pressure_array = load_pressure_array(json_path)
+        if pressure_array is None:
             print(f"⚠️ 경고: '{os.path.basename(json_path)}' 파일에 'RawPressureByRows' 데이터가 없습니다.")
             return
 
-        sorted_keys = sorted(pressure_rows.keys(), key=lambda x: int(x.split('_')[1]))
-        pressure_matrix = []
-        for key in sorted_keys:
-            row_data = [int(p) for p in pressure_rows[key].split(', ')]
-            pressure_matrix.append(row_data)
-        pressure_array = np.array(pressure_matrix)
-
-        # 노이즈 제거 (시각화용)
+        # 노이즈 제거는 파일당 한 번만 수행하고 시각화/분포 계산이 함께 사용합니다.
         cleaned_array_for_viz = filter_noise(pressure_array)
-        
+
         rows, cols = cleaned_array_for_viz.shape
         mid_col = cols // 2
-        
+
+        # --- 압력 분포 계산 (계산은 원본 데이터로 수행, 렌더 경로와 무관) ---
+        global_bbox = get_foot_bbox(cleaned_array_for_viz)
+        distribution = calculate_pressure_distribution(pressure_array,
+                                                       cleaned_array=cleaned_array_for_viz,
+                                                       global_bbox=global_bbox)
+
+        if distribution:
+            dist_str = ", ".join([f"{k}({v:.1f}%)" for k, v in distribution.items()])
+            print(f"  - 압력 분포: {dist_str}")
+            total_percent = sum(distribution.values())
+            print(f"  - 총합: {total_percent:.1f}%")
+
+        # 분석 수치만 필요한 배치 모드에서는 렌더링 전체를 건너뜁니다
+        if not render:
+            return
+
+        if FAST_RENDER:
+            _save_heatmap_fast(output_path, cleaned_array_for_viz, distribution, global_bbox)
+            print(f"✅ 분석 이미지 생성 완료: {os.path.basename(output_path)}")
+            return
+
         # --- 시각화 (노이즈 제거된 데이터 사용) ---
-        fig, ax = plt.subplots(figsize=(4, 8))
+        fig, ax = _get_figure()
+        ax.clear()
         fig.set_facecolor('black')
         ax.set_facecolor('black')
 
-        cmap = plt.get_cmap('jet') 
-        ax.imshow(cleaned_array_for_viz, cmap=cmap, interpolation='nearest')
-        
+        ax.imshow(cleaned_array_for_viz, cmap=_CMAP_JET, interpolation='nearest')
+
         # --- 영역 구분선 그리기 (통합 BBox 기준) ---
-        global_bbox = get_foot_bbox(cleaned_array_for_viz)
         if global_bbox:
             min_r, max_r = global_bbox
             global_height = max_r - min_r + 1
             if global_height >= 3:
-                hind_end_r = min_r + global_height // 3
-                mid_end_r = min_r + (global_height * 2) // 3
+                hind_end_r, mid_end_r = _region_boundaries(min_r, max_r)
                 # 양발에 걸쳐 전체 너비로 선 그리기
                 ax.axhline(y=hind_end_r - 0.5, xmin=0.05, xmax=0.95, color='white', linestyle='--', linewidth=1.5)
                 ax.axhline(y=mid_end_r - 0.5, xmin=0.05, xmax=0.95, color='white', linestyle='--', linewidth=1.5)
 
         ax.axis('off')
 
-        # --- 압력 분포 계산 및 표시 (계산은 원본 데이터로 수행) ---
-        distribution = calculate_pressure_distribution(pressure_array)
-        
+        # --- 압력 분포 텍스트 표시 ---
         if distribution:
             text_y_center = rows / 2
             text_x_left = mid_col / 2
@@ -159,14 +331,8 @@ def create_heatmap_from_json(json_path, output_path):
             ax.text(text_x_right, text_y_center, f"중간: {distribution.get('RM', 0):.1f}%", **text_props)
             ax.text(text_x_right, text_y_center + (rows * 0.25), f"앞: {distribution.get('RF', 0):.1f}%", **text_props)
 
-            dist_str = ", ".join([f"{k}({v:.1f}%)" for k, v in distribution.items()])
-            print(f"  - 압력 분포: {dist_str}")
-            total_percent = sum(distribution.values())
-            print(f"  - 총합: {total_percent:.1f}%")
+        fig.savefig(output_path, bbox_inches='tight', pad_inches=0, facecolor='black')
 
-        plt.savefig(output_path, bbox_inches='tight', pad_inches=0, facecolor='black')
-        plt.close(fig)
-        
         print(f"✅ 분석 이미지 생성 완료: {os.path.basename(output_path)}")
 
     except FileNotFoundError:
@@ -174,7 +340,18 @@ def create_heatmap_from_json(json_path, output_path):
     except Exception as e:
         print(f"❗️ 오류: '{os.path.basename(json_path)}' 처리 중 예상치 못한 오류 발생 - {e}")
 
+def _process_one(input_path, output_dir, render=True):
+    """파일 하나를 처리합니다 (워커 프로세스에서 실행)."""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    input_basename = os.path.splitext(os.path.basename(input_path))[0]
+    output_filename = f"{input_basename}_{timestamp}_analysis.png"
+    output_path = os.path.join(output_dir, output_filename)
+    print(f"\n▶️ 처리 중: {os.path.basename(input_path)}")
+    create_heatmap_from_json(input_path, output_path, render=render)
+
 if __name__ == '__main__':
+    # --no-render: PNG 생성 없이 분포 수치만 출력 (분석 전용 배치 모드)
+    render_enabled = '--no-render' not in sys.argv
     base_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(base_dir)
     input_dir = os.path.join(project_root, 'data', 'input')
@@ -184,10 +361,6 @@ if __name__ == '__main__':
         print(f"'{input_dir}' 폴더에 분석할 JSON 파일이 없습니다.")
     else:
         print(f"총 {len(json_files)}개의 파일을 분석합니다.")
-        for input_path in json_files:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            input_basename = os.path.splitext(os.path.basename(input_path))[0]
-            output_filename = f"{input_basename}_{timestamp}_analysis.png"
-            output_path = os.path.join(output_dir, output_filename)
-            print(f"\n▶️ 처리 중: {os.path.basename(input_path)}")
-            create_heatmap_from_json(input_path, output_path) 
\ No newline at end of file
+        # 파일별 처리(파싱 + PNG 인코딩)는 서로 독립이므로 프로세스 풀로 병렬화
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(functools.partial(_process_one, render=render_enabled, output_dir=output_dir), json_files))
\ No newline at end of file
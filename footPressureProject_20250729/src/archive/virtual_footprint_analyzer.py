@@ -1,37 +1,143 @@
+import functools
 import json
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 워커 프로세스에서 GUI 백엔드 초기화를 막기 위해 pyplot보다 먼저 지정
 import matplotlib.pyplot as plt
 import os
 import glob
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import matplotlib.font_manager as fm
-from scipy.ndimage import binary_opening # 노이즈 제거를 위해 임포트
+from scipy.ndimage import binary_erosion, binary_dilation, iterate_structure # 노이즈 제거를 위해 임포트
+from scipy.signal import fftconvolve
+
+# orjson은 선택 설치 - 있으면 stdlib json보다 3~5배 빠르게 파싱합니다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numba는 선택 설치 - 없으면 기존 NumPy 경로를 그대로 사용합니다.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # --- 한글 폰트 설정 ---
 try:
     font_path = '/System/Library/Fonts/AppleSDGothicNeo.ttc'
     font_prop = fm.FontProperties(fname=font_path)
+    # 폰트를 fontManager에 등록해 두면 text 호출마다 파일 경로를 재해석하지 않습니다.
+    fm.fontManager.addfont(font_path)
     plt.rcParams['font.family'] = font_prop.get_name()
     plt.rcParams['axes.unicode_minus'] = False
 except FileNotFoundError:
     print("⚠️ 경고: Apple SD Gothic Neo 폰트를 찾을 수 없습니다. 텍스트가 깨질 수 있습니다.")
     font_prop = None # 폰트가 없으면 None으로 설정
 
+# --- 재사용 시각화 리소스 ---
+# 파일마다 plt.subplots/close를 반복하면 Figure 생성·해제 비용이 누적되므로
+# 프로세스당 하나의 Figure/Axes를 만들어 clear 후 재사용합니다.
+_FIG = None
+_AX = None
+_CMAP_JET = plt.get_cmap('jet')
+
+def _get_figure():
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=(4, 8))
+    return _FIG, _AX
+
+# 기본 min_size(=3)용 구조 요소는 호출마다 다시 만들지 않도록 모듈 스코프에 둡니다.
+_OPEN_STRUCT = np.ones((2, 2), dtype=bool)
+_OPEN_STRUCT_MERGED = iterate_structure(_OPEN_STRUCT, 3)
+
+# 6개 구역 키 (분포 배열 ↔ 딕셔너리 변환용 고정 순서)
+_ZONE_KEYS = ('LH', 'LM', 'LF', 'RH', 'RM', 'RF')
+
+# 배치 실행에서 센서 geometry가 파일마다 동일하므로 중간 버퍼를 프로세스 단위로 재사용합니다.
+_BUF = {'mask': None, 'cleaned': None}
+
 # --- 분석 함수 ---
 
+def _opening_fft(binary_mask, structure):
+    """큰 구조 요소용 FFT 기반 열림(erosion 후 dilation) 연산."""
+    area = structure.sum()
+    eroded = fftconvolve(binary_mask.astype(np.float64), structure, mode='same') > area - 0.1
+    return fftconvolve(eroded.astype(np.float64), structure, mode='same') > 0.1
+
 def filter_noise(pressure_array, min_size=3):
     """
     압력 배열에서 지정된 크기(min_size)보다 작은 연결된 점들을 노이즈로 간주하고 제거합니다.
+    반복 opening 대신 병합된 구조 요소로 침식+팽창을 한 번씩만 수행합니다.
+    반환 배열은 프로세스 단위로 재사용되는 버퍼이므로 다음 호출 전까지만 유효합니다.
     """
-    binary_mask = pressure_array > 0
-    cleaned_mask = binary_opening(binary_mask, structure=np.ones((2,2)), iterations=min_size)
-    return pressure_array * cleaned_mask
+    binary_mask = _BUF['mask']
+    if binary_mask is None or binary_mask.shape != pressure_array.shape \
+            or _BUF['cleaned'].dtype != pressure_array.dtype:
+        _BUF['mask'] = binary_mask = np.empty(pressure_array.shape, dtype=bool)
+        _BUF['cleaned'] = np.empty_like(pressure_array)
+    np.greater(pressure_array, 0, out=binary_mask)
+    structure = _OPEN_STRUCT_MERGED if min_size == 3 else iterate_structure(_OPEN_STRUCT, min_size)
+    if structure.sum() <= 100:
+        cleaned_mask = binary_dilation(binary_erosion(binary_mask, structure=structure), structure=structure)
+    else:
+        cleaned_mask = _opening_fft(binary_mask, structure)
+
+    # 전체 곱셈 대신 제거된 픽셀만 0으로 덮어씁니다
+    # (노이즈는 희소하므로 마스크드 스토어가 캐시 친화적)
+    cleaned = _BUF['cleaned']
+    np.copyto(cleaned, pressure_array)
+    np.logical_not(cleaned_mask, out=cleaned_mask)
+    cleaned[cleaned_mask] = 0
+    return cleaned
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _bbox_and_com_jit(a):
+        """
+        bbox(min_r, max_r)·세로 무게중심·총압력을 배열 1회 순회로 모두 계산합니다.
+        (argwhere/np.indices 할당 없이 세 개의 리덕션을 하나로 융합)
+        """
+        min_r = -1
+        max_r = -1
+        s = 0.0
+        w = 0.0
+        for i in range(a.shape[0]):
+            row_has = False
+            for j in range(a.shape[1]):
+                v = a[i, j]
+                if v > 0:
+                    row_has = True
+                    s += i * v
+                    w += v
+            if row_has:
+                if min_r < 0:
+                    min_r = i
+                max_r = i
+        com_y = s / w if w > 0 else -1.0
+        return min_r, max_r, com_y, w
+
+    # 첫 호출의 컴파일 지연을 임포트 시점으로 이동
+    try:
+        _ = _bbox_and_com_jit(np.zeros((2, 2), dtype=np.int16))
+    except Exception:
+        pass
 
 def get_foot_bbox(foot_array):
     """
     단일 발 압력 배열로부터 압력이 감지된 영역의 세로 Bounding Box (min_row, max_row)를 반환합니다.
     압력이 없으면 None을 반환합니다.
     """
+    if NUMBA_AVAILABLE:
+        min_row, max_row, _, _ = _bbox_and_com_jit(np.ascontiguousarray(foot_array))
+        if min_row < 0:
+            return None
+        return min_row, max_row
+
     coords = np.argwhere(foot_array > 0)
     if coords.shape[0] == 0:
         return None
@@ -43,30 +149,42 @@ def get_center_of_mass(foot_array):
     """
     압력 배열의 세로 무게 중심(y-coordinate)을 계산합니다.
     """
-    total_pressure = np.sum(foot_array)
+    if NUMBA_AVAILABLE:
+        _, _, com_y, _ = _bbox_and_com_jit(np.ascontiguousarray(foot_array))
+        return None if com_y < 0 else com_y
+
+    # 행 합을 먼저 구하면 (H,W) 곱셈/할당이 (H,) 곱셈으로 줄어듭니다.
+    row_sums = foot_array.sum(axis=1)
+    total_pressure = row_sums.sum()
     if total_pressure == 0:
         return None
-    
-    y_indices, _ = np.indices(foot_array.shape)
-    
-    com_y = np.sum(y_indices * foot_array) / total_pressure
-    
+
+    com_y = (np.arange(foot_array.shape[0]) * row_sums).sum() / total_pressure
+
     return com_y
 
 def infer_virtual_footprint(foot_array, sensor_total_rows):
     """
     [V2.1] 감지된 압력의 '무게 중심'을 기반으로 '가상 발자국' BBox를 추론합니다.
     """
-    detected_bbox = get_foot_bbox(foot_array)
-    if not detected_bbox:
-        return None
+    if NUMBA_AVAILABLE:
+        # bbox와 무게중심을 융합 커널 한 번으로 얻습니다 (배열 순회 3회 → 1회)
+        min_r, max_r, com_y, _ = _bbox_and_com_jit(np.ascontiguousarray(foot_array))
+        if min_r < 0:
+            return None
+        detected_bbox = (min_r, max_r)
+        if com_y < 0:
+            com_y = None
+    else:
+        detected_bbox = get_foot_bbox(foot_array)
+        if not detected_bbox:
+            return None
+        com_y = get_center_of_mass(foot_array)
+        min_r, max_r = detected_bbox
 
-    com_y = get_center_of_mass(foot_array)
     # 무게 중심 계산이 불가능하면 (압력이 없으면) 추론하지 않음
     if com_y is None:
         return detected_bbox
-
-    min_r, max_r = detected_bbox
     detected_height = max_r - min_r + 1
 
     # 안전 장치: 감지된 발자국이 이미 매우 크면(센서의 50% 이상) 추론하지 않음
@@ -96,16 +214,23 @@ def infer_virtual_footprint(foot_array, sensor_total_rows):
     return detected_bbox
 
 
-def calculate_pressure_distribution(pressure_array):
+@functools.lru_cache(maxsize=256)
+def _region_boundaries(min_r, max_r):
+    """통합 bbox의 1/3, 2/3 경계 행을 반환합니다 (bbox별로 한 번만 계산)."""
+    height = max_r - min_r + 1
+    return min_r + height // 3, min_r + (height * 2) // 3
+
+def calculate_pressure_distribution(pressure_array, cleaned_array=None):
     """
     [V2.2.1] 가상 발자국 추론, 최소 압력 임계값(Threshold) 적용, 100% 재조정
+    호출자가 이미 노이즈를 제거한 배열을 넘기면 filter_noise를 다시 돌리지 않습니다.
     """
     total_pressure_original = np.sum(pressure_array)
     if total_pressure_original == 0:
         return {}, None
 
     # 노이즈 제거는 추론 및 시각화에만 사용
-    cleaned_array_for_inference = filter_noise(pressure_array)
+    cleaned_array_for_inference = filter_noise(pressure_array) if cleaned_array is None else cleaned_array
     
     rows, cols = cleaned_array_for_inference.shape
     mid_col = cols // 2
@@ -134,87 +259,107 @@ def calculate_pressure_distribution(pressure_array):
         return {}, final_bbox
 
     # 통합 기준선 계산
-    hind_end_r = final_min_r + final_height // 3
-    mid_end_r = final_min_r + (final_height * 2) // 3
+    hind_end_r, mid_end_r = _region_boundaries(final_min_r, final_max_r)
 
     # 1. 각 구역별 'raw' 압력 계산
-    original_left_foot = pressure_array[:, :mid_col]
-    original_right_foot = pressure_array[:, mid_col:]
-
-    raw_distribution = {
-        'LH': np.sum(original_left_foot[final_min_r:hind_end_r, :]),
-        'LM': np.sum(original_left_foot[hind_end_r:mid_end_r, :]),
-        'LF': np.sum(original_left_foot[mid_end_r:final_max_r + 1, :]),
-        'RH': np.sum(original_right_foot[final_min_r:hind_end_r, :]),
-        'RM': np.sum(original_right_foot[hind_end_r:mid_end_r, :]),
-        'RF': np.sum(original_right_foot[mid_end_r:final_max_r + 1, :]),
-    }
+    # 발별 행 합을 한 번만 구한 뒤 reduceat으로 세 구역 합을 한꺼번에 얻습니다.
+    left_row_sums = pressure_array[final_min_r:final_max_r + 1, :mid_col].sum(axis=1)
+    right_row_sums = pressure_array[final_min_r:final_max_r + 1, mid_col:].sum(axis=1)
+    zone_offsets = np.array([0, hind_end_r - final_min_r, mid_end_r - final_min_r])
+
+    raw = np.concatenate((np.add.reduceat(left_row_sums, zone_offsets),
+                          np.add.reduceat(right_row_sums, zone_offsets))).astype(np.float64)
 
     # 2. '최소 압력 임계값' 적용 (수정된 로직)
-    # 전체 압력의 1% 미만인 구역은 노이즈로 간주하여 0으로 처리
+    # 전체 압력의 1% 미만인 구역은 노이즈로 간주하여 0으로 처리 (벡터 연산)
     pressure_threshold = total_pressure_original * 0.01
-    
-    # 임계값보다 작은 raw 압력 값을 0으로 변경
-    for key, value in raw_distribution.items():
-        if value < pressure_threshold:
-            raw_distribution[key] = 0
+    raw[raw < pressure_threshold] = 0
 
     # 3. 100% 기준으로 재조정 (Re-normalization)
-    new_total_pressure = sum(raw_distribution.values())
+    new_total_pressure = raw.sum()
     if new_total_pressure == 0:
-        return {key: 0 for key in raw_distribution}, final_bbox
+        return {key: 0 for key in _ZONE_KEYS}, final_bbox
+
+    return dict(zip(_ZONE_KEYS, raw * (100.0 / new_total_pressure))), final_bbox
 
-    final_distribution = {
-        key: (value / new_total_pressure) * 100
-        for key, value in raw_distribution.items()
-    }
-        
-    return final_distribution, final_bbox
 
+@functools.lru_cache(maxsize=8)
+def _row_keys(n):
+    """센서 행 수 n에 대한 "Row_0".."Row_{n-1}" 키 목록 (레이아웃별로 한 번만 생성)."""
+    return [f"Row_{i}" for i in range(n)]
 
-def create_heatmap_from_json(json_path, output_path):
+def _sorted_row_keys(pressure_rows):
+    """
+    키가 표준 Row_0..Row_{N-1} 패턴이면 정렬 없이 생성된 목록을 반환합니다.
+    (파일마다 N번의 문자열 분해 + 정렬을 멤버십 확인으로 대체)
+    """
+    keys = _row_keys(len(pressure_rows))
+    if all(k in pressure_rows for k in keys):
+        return keys
+    # 비표준 키 패턴이면 기존 정렬 경로로 폴백
+    return sorted(pressure_rows.keys(), key=lambda x: int(x[4:]))
+
+def create_heatmap_from_json(json_path, output_path, render=True):
     """
     [V2.2.1] JSON 파일을 읽어 최종 완성본 히트맵과 분석 결과를 생성합니다.
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         pressure_rows = data.get('RawPressureByRows')
         if not pressure_rows:
             print(f"⚠️ 경고: '{os.path.basename(json_path)}' 파일에 'RawPressureByRows' 데이터가 없습니다.")
             return
 
-        sorted_keys = sorted(pressure_rows.keys(), key=lambda x: int(x.split('_')[1]))
-        pressure_matrix = []
-        for key in sorted_keys:
-            row_data = [int(p) for p in pressure_rows[key].split(', ')]
-            pressure_matrix.append(row_data)
-        pressure_array = np.array(pressure_matrix)
+        sorted_keys = _sorted_row_keys(pressure_rows)
 
-        # 압력 분포 계산 및 가상 발자국 정보 얻기
-        distribution, final_bbox = calculate_pressure_distribution(pressure_array)
+        # 파이썬 int() 루프 대신 행 문자열을 C 레벨에서 바로 파싱해 버퍼를 채웁니다.
+        # 센서 값은 작은 정수이므로 int16으로 저장해 캐시/대역폭 사용량을 절반으로 줄입니다.
+        # (np.sum은 int16을 자동으로 int64로 누적하므로 오버플로 걱정 없음)
+        first_row = np.fromstring(pressure_rows[sorted_keys[0]], dtype=np.int16, sep=',')
+        pressure_array = np.empty((len(sorted_keys), first_row.shape[0]), dtype=np.int16)
+        pressure_array[0] = first_row
+        for i, key in enumerate(sorted_keys[1:], start=1):
+            pressure_array[i] = np.fromstring(pressure_rows[key], dtype=np.int16, sep=',')
 
-        # 시각화용 노이즈 제거
+        # 노이즈 제거는 파일당 한 번만 수행하고 분포 계산/시각화가 함께 사용
         cleaned_array_for_viz = filter_noise(pressure_array)
+
+        # 압력 분포 계산 및 가상 발자국 정보 얻기
+        distribution, final_bbox = calculate_pressure_distribution(pressure_array,
+                                                                   cleaned_array=cleaned_array_for_viz)
         rows, cols = cleaned_array_for_viz.shape
         mid_col = cols // 2
-        
+
+        if distribution:
+            dist_str = ", ".join([f"{k}({v:.1f}%)" for k, v in distribution.items()])
+            print(f"  - 압력 분포: {dist_str}")
+            total_percent = sum(distribution.values())
+            print(f"  - 총합: {total_percent:.1f}%")
+
+        # 분석 수치만 필요한 배치 모드에서는 렌더링 전체를 건너뜁니다
+        if not render:
+            return
+
         # --- 시각화 ---
-        fig, ax = plt.subplots(figsize=(4, 8))
+        fig, ax = _get_figure()
+        ax.clear()
         fig.set_facecolor('black')
         ax.set_facecolor('black')
 
-        cmap = plt.get_cmap('jet') 
-        ax.imshow(cleaned_array_for_viz, cmap=cmap, interpolation='nearest')
+        ax.imshow(cleaned_array_for_viz, cmap=_CMAP_JET, interpolation='nearest')
         
         # --- 영역 구분선 그리기 (추론된 최종 BBox 기준) ---
         if final_bbox:
             min_r, max_r = final_bbox
             height = max_r - min_r + 1
             if height >= 3:
-                hind_end_r = min_r + height // 3
-                mid_end_r = min_r + (height * 2) // 3
+                hind_end_r, mid_end_r = _region_boundaries(min_r, max_r)
                 ax.axhline(y=hind_end_r - 0.5, xmin=0.05, xmax=0.95, color='white', linestyle='--', linewidth=1.5)
                 ax.axhline(y=mid_end_r - 0.5, xmin=0.05, xmax=0.95, color='white', linestyle='--', linewidth=1.5)
                 # 가상 발자국 영역 표시 (디버깅용)
@@ -236,14 +381,8 @@ def create_heatmap_from_json(json_path, output_path):
             ax.text(text_x_right, text_y_center, f"중간: {distribution.get('RM', 0):.1f}%", **text_props)
             ax.text(text_x_right, text_y_center + (rows * 0.25), f"앞: {distribution.get('RF', 0):.1f}%", **text_props)
 
-            dist_str = ", ".join([f"{k}({v:.1f}%)" for k, v in distribution.items()])
-            print(f"  - 압력 분포: {dist_str}")
-            total_percent = sum(distribution.values())
-            print(f"  - 총합: {total_percent:.1f}%")
+        fig.savefig(output_path, bbox_inches='tight', pad_inches=0, facecolor='black')
 
-        plt.savefig(output_path, bbox_inches='tight', pad_inches=0, facecolor='black')
-        plt.close(fig)
-        
         print(f"✅ 분석 이미지 생성 완료: {os.path.basename(output_path)}")
 
     except FileNotFoundError:
@@ -251,25 +390,32 @@ def create_heatmap_from_json(json_path, output_path):
     except Exception as e:
         print(f"❗️ 오류: '{os.path.basename(json_path)}' 처리 중 예상치 못한 오류 발생 - {e}")
 
+def _process_one(input_path, output_dir, render=True):
+    """파일 하나를 처리합니다 (워커 프로세스에서 실행)."""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    input_basename = os.path.splitext(os.path.basename(input_path))[0]
+    output_filename = f"{input_basename}_{timestamp}_analysis_v2.2.1_final.png"
+    output_path = os.path.join(output_dir, output_filename)
+    print(f"\n▶️ 처리 중: {os.path.basename(input_path)}")
+    create_heatmap_from_json(input_path, output_path, render=render)
+
 if __name__ == '__main__':
+    # --no-render: PNG 생성 없이 분포 수치만 출력 (분석 전용 배치 모드)
+    render_enabled = '--no-render' not in sys.argv
     base_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(base_dir)
     input_dir = os.path.join(project_root, 'data', 'input')
     output_dir = os.path.join(project_root, 'data', 'output')
-    
+
     # 출력 폴더를 버전별로 관리 (버그 수정 버전)
     output_dir_final = os.path.join(output_dir, 'v2.2.1_final_corrected')
     os.makedirs(output_dir_final, exist_ok=True)
-    
+
     json_files = glob.glob(os.path.join(input_dir, '*.json'))
     if not json_files:
         print(f"'{input_dir}' 폴더에 분석할 JSON 파일이 없습니다.")
     else:
         print(f"총 {len(json_files)}개의 파일을 '가상 발자국' 분석기 V2.2.1(최종 수정본)로 분석합니다.")
-        for input_path in json_files:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            input_basename = os.path.splitext(os.path.basename(input_path))[0]
-            output_filename = f"{input_basename}_{timestamp}_analysis_v2.2.1_final.png"
-            output_path = os.path.join(output_dir_final, output_filename)
-            print(f"\n▶️ 처리 중: {os.path.basename(input_path)}")
-            create_heatmap_from_json(input_path, output_path) 
\ No newline at end of file
+        # 파일별 처리(파싱 + PNG 인코딩)는 서로 독립이므로 프로세스 풀로 병렬화
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(functools.partial(_process_one, render=render_enabled, output_dir=output_dir_final), json_files))
\ No newline at end of file
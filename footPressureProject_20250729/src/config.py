@@ -44,6 +44,8 @@ def find_font():
 KOR_FONT_PATH = find_font()
 
 VISUALIZATION = {
+    'fast_render': False,           # True면 matplotlib 대신 PIL LUT 기반 고속 렌더링 사용
+    'fast_render_scale': 8,         # 고속 렌더링 시 센서 셀 1개당 픽셀 수
     'dpi': 150,                     # 이미지 해상도
     'figsize': (8, 10),             # 이미지 크기 (인치)
     'cmap': 'plasma',              # 압력 분포에 사용할 컬러맵
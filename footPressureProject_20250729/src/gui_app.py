@@ -1,18 +1,50 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk
+import gc
+import multiprocessing
 import os
-import threading
 import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from _gui_base import LoggingTkMixin
 from analyzer_engine import FootPressureAnalyzer
 from config import OUTPUT_DIR, FONT_PROP, VISUALIZATION
 
-class FootPressureApp(tk.Tk):
+# 텍스트 속성 dict는 내용이 고정이므로 매 렌더링마다 새로 만들지 않고 재사용합니다
+_TEXT_PROPS_DIST = {'color': VISUALIZATION['FONT_COLOR_DIST'], 'fontsize': VISUALIZATION['FONT_SIZE_DIST'],
+                    'ha': 'center', 'va': 'center', 'fontproperties': FONT_PROP}
+_TEXT_PROPS_TYPE = {'color': VISUALIZATION['FONT_COLOR_TYPE'], 'fontsize': VISUALIZATION['FONT_SIZE_TYPE'],
+                    'ha': 'center', 'weight': 'bold', 'fontproperties': FONT_PROP}
+
+def _run_analyzer_worker(input_path, log_queue):
+    """
+    워커 프로세스에서 분석을 수행하고 시각화 데이터를 반환합니다.
+    (프로세스 경계를 넘어야 하므로 모듈 레벨 함수로 둡니다)
+    """
+    t0 = time.perf_counter()
+
+    def logger(message):
+        # datetime.strftime은 메시지당 ~10µs로 비싸므로 경과 시간만 기록합니다
+        t = time.perf_counter() - t0
+        try:
+            log_queue.put_nowait(f"[{t:7.3f}s] {message}")
+        except queue.Full:
+            pass  # UI가 못 따라가면 워커 쪽 메시지는 버립니다 (분석을 막지 않음)
+
+    analyzer = FootPressureAnalyzer(input_path, ui_logger=logger)
+    if not analyzer.run_analysis():
+        raise RuntimeError("분석 실행에 실패했습니다. 데이터를 확인해주세요.")
+
+    logger("시각화 데이터 생성 중...")
+    vis_data = analyzer.get_visualization_data()
+    if not vis_data:
+        raise RuntimeError("시각화 데이터를 생성할 수 없습니다.")
+    logger("시각화 데이터 생성 완료.")
+    return vis_data
+
+class FootPressureApp(LoggingTkMixin, tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("족저압 분석기")
@@ -20,8 +52,18 @@ class FootPressureApp(tk.Tk):
 
         # 입력 파일 경로
         self.input_path = tk.StringVar()
-        self.log_queue = queue.Queue()
+        # 워커 프로세스와 공유해야 하므로 Manager 큐를 사용합니다
+        # (무한정 쌓이지 않도록 상한을 두고, 넘치는 메시지는 개수만 집계합니다)
+        self._log_manager = multiprocessing.Manager()
+        self.log_queue = self._log_manager.Queue(2000)
+        self._dropped_logs = 0
         self.log_poller = None
+        self._pending_draw_token = 0  # 연속 분석 시 밀린 렌더링을 건너뛰기 위한 토큰
+        self._t0 = time.perf_counter()  # 로그 타임스탬프 기준 시각
+        self._analysis_running = False  # False이고 큐가 비면 폴러가 스스로 멈춥니다
+
+        # CPU 바운드 분석이 GIL에 묶이지 않도록 프로세스 풀에서 실행합니다
+        self._pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2))
 
         # UI 위젯 생성 및 배치
         self._create_widgets()
@@ -66,42 +108,75 @@ class FootPressureApp(tk.Tk):
         status_frame.pack(fill=tk.X, side=tk.BOTTOM)
 
         # --- Matplotlib Canvas ---
+        # pyplot + TkAgg 백엔드 import는 수백 ms가 걸리므로 창 구성 시점까지 늦춥니다
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         self.fig, self.ax = plt.subplots(figsize=(5, 8))
         self.canvas = FigureCanvasTkAgg(self.fig, master=image_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
-        
-        # --- 로그 텍스트 ---
-        self.log_text = tk.Text(log_frame, wrap=tk.WORD, state=tk.DISABLED)
-        self.log_scrollbar = tk.Scrollbar(log_frame, command=self.log_text.yview)
-        self.log_text.config(yscrollcommand=self.log_scrollbar.set)
-        
-        self.log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
+
+        # --- 블리팅 상태 ---
+        # 전체 draw 후 배경을 캡처해 두고, 이후 갱신은 변경된 아티스트만 다시 그립니다.
+        # (매 분석마다 전체 히트맵을 재래스터화하지 않음)
+        self._im = None              # 재사용할 AxesImage
+        self._bg = None              # copy_from_bbox로 캡처한 배경
+        self._detail_artists = []    # _draw_details_on_ax가 만든 동적 아티스트들
+        self._layout_done = False    # tight_layout은 geometry가 바뀐 뒤 첫 렌더링에만
+        self._resize_after = None    # 리사이즈 디바운스용 after 핸들
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+        # Tk는 드래그 중 픽셀 단위로 <Configure>를 쏟아내므로 재렌더링은 디바운스합니다
+        # (백엔드 자체 바인딩을 덮어쓰지 않도록 add='+')
+        self.canvas_widget.bind("<Configure>", self._on_resize, add='+')
+
+        # --- 로그 텍스트 (공유 믹스인) ---
+        self._create_log_widgets(log_frame)
+
+
         # --- 상태 표시 라벨 ---
         self.status_label = tk.Label(status_frame, text="준비 완료", anchor="w")
         self.status_label.pack(fill=tk.X)
 
     def _process_log_queue(self):
-        """주기적으로 로그 큐를 확인하여 UI를 업데이트합니다. UI 프리징을 방지하기 위해 한번에 최대 50개까지만 처리합니다."""
-        for _ in range(50): # 한번에 최대 50개 메시지만 처리
+        """주기적으로 로그 큐를 확인하여 UI를 업데이트합니다. UI 프리징을 방지하기 위해 한번에 최대 500개까지만 처리합니다."""
+        # 메시지를 리스트로 모아 한 번의 insert로 반영합니다
+        # (메시지마다 state 토글 + insert + see를 반복하면 Tcl/Tk 왕복이 메시지 수만큼 발생)
+        messages = []
+        for _ in range(500):
             try:
-                message = self.log_queue.get_nowait()
-                self.log_text.config(state=tk.NORMAL)
-                self.log_text.insert(tk.END, message + "\n")
-                self.log_text.see(tk.END)
-                self.log_text.config(state=tk.DISABLED)
+                messages.append(self.log_queue.get_nowait())
             except queue.Empty:
                 break # 큐가 비었으면 중단
-        
-        # 100ms 마다 다시 확인하도록 예약
-        self.log_poller = self.after(100, self._process_log_queue)
+
+        # 큐가 가득 차서 버려진 메시지는 한 줄 요약으로만 알립니다
+        if self._dropped_logs:
+            messages.append(f"... [{self._dropped_logs} log messages dropped]")
+            self._dropped_logs = 0
+
+        if messages:
+            self._append_log_lines("\n".join(messages) + "\n")
+            self._trim_log()  # 수천 줄이 쌓이면 앞쪽부터 잘라 insert를 O(1)로 유지
+
+        # 분석이 끝나고 큐도 비었으면 더 이상 폴링하지 않습니다
+        if not self._analysis_running and self.log_queue.empty():
+            self.log_poller = None
+            return
+
+        # 큐 압력에 따라 폴링 주기를 조절합니다
+        # (메시지가 쏟아질 때는 30ms로 촘촘히, 한가할 때는 250ms로 느슨하게)
+        drained = len(messages)
+        next_ms = 30 if drained >= 20 else 100 if drained else 250
+        self.log_poller = self.after(next_ms, self._process_log_queue)
 
     def _log_to_ui(self, message):
-        """타임스탬프와 함께 UI 로그 큐에 메시지를 추가합니다."""
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        self.log_queue.put(f"[{timestamp}] {message}")
+        """경과 시간 타임스탬프와 함께 UI 로그 큐에 메시지를 추가합니다."""
+        # datetime 객체 생성 + strftime 대신 float 포매팅만 사용 (메시지당 수 µs 절약)
+        t = time.perf_counter() - self._t0
+        try:
+            self.log_queue.put_nowait(f"[{t:7.3f}s] {message}")
+        except queue.Full:
+            self._dropped_logs += 1
 
     def browse_file(self):
         initial_dir = os.path.join(os.getcwd(), 'data', 'input')
@@ -126,11 +201,13 @@ class FootPressureApp(tk.Tk):
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
         
+        # 경계 라인에만 벽시계 시각을 남깁니다 (개별 메시지는 경과 시간만 기록)
         self._log_to_ui("="*50)
-        self._log_to_ui(f"분석 시작: {os.path.basename(input_path)}")
+        self._log_to_ui(f"분석 시작: {os.path.basename(input_path)} ({datetime.now().strftime('%H:%M:%S')})")
         self._log_to_ui("="*50)
 
         # 로그 큐 폴링 시작
+        self._analysis_running = True
         if self.log_poller:
             self.after_cancel(self.log_poller)
         self._process_log_queue()
@@ -139,43 +216,30 @@ class FootPressureApp(tk.Tk):
         self.btn_run.config(state=tk.DISABLED)
         self.btn_browse.config(state=tk.DISABLED)
         
-        # 백그라운드 스레드에서 분석 실행
-        # UI 로깅을 위해 self._log_to_ui 콜백을 전달
-        thread = threading.Thread(target=self._threaded_analysis, args=(input_path, self._log_to_ui))
-        thread.daemon = True
-        thread.start()
-
-    def _threaded_analysis(self, input_path, ui_logger):
-        """백그라운드 스레드에서 실행될 분석 함수"""
-        try:
-            # 1. 분석기 인스턴스 생성 및 실행 (UI 로거 콜백 전달)
-            analyzer = FootPressureAnalyzer(input_path, ui_logger=ui_logger)
-            success = analyzer.run_analysis()
-            
-            if not success:
-                 raise Exception("분석 실행에 실패했습니다. 데이터를 확인해주세요.")
-
-            # 2. 시각화 데이터 가져오기
-            ui_logger("시각화 데이터 생성 중...")
-            vis_data = analyzer.get_visualization_data()
-            if not vis_data:
-                raise Exception("시각화 데이터를 생성할 수 없습니다.")
-            ui_logger("시각화 데이터 생성 완료.")
-
-            # 3. 메인 스레드에서 UI 업데이트 예약
-            self.after(0, self.on_analysis_complete, vis_data, None)
+        # 워커 프로세스에서 분석 실행 (스레드와 달리 GIL에 묶이지 않음)
+        # 로그는 Manager 큐를 통해 기존 폴링 루프로 전달됩니다
+        future = self._pool.submit(_run_analyzer_worker, input_path, self.log_queue)
+        future.add_done_callback(self._on_analysis_future_done)
+
+    def _on_analysis_future_done(self, future):
+        """워커 프로세스 완료 콜백 (풀의 스레드에서 호출됨) - 결과를 메인 스레드로 넘깁니다."""
+        error = future.exception()
+        if error:
+            self._log_to_ui(f"오류 발생: {error}")
+            self.after(0, self.on_analysis_complete, None, error)
+        else:
+            self.after(0, self.on_analysis_complete, future.result(), None)
 
-        except Exception as e:
-            # 오류 발생 시 메인 스레드에 오류 정보 전달
-            ui_logger(f"오류 발생: {e}")
-            self.after(0, self.on_analysis_complete, None, e)
-            
     def on_analysis_complete(self, vis_data, error):
         """분석 완료 후 메인 스레드에서 호출될 콜백 함수"""
-        # 로그 큐 폴링 중지
-        if self.log_poller:
-            self.after_cancel(self.log_poller)
-            self.log_poller = None
+        # 남은 메시지를 모두 비운 뒤 폴러가 스스로 멈추도록 플래그만 내립니다
+        self._analysis_running = False
+        if self.log_poller is None:
+            self._process_log_queue()
+
+        # 버튼을 먼저 다시 활성화해 무거운 렌더링 전에 UI가 풀린 것을 보여줍니다
+        self.btn_run.config(state=tk.NORMAL)
+        self.btn_browse.config(state=tk.NORMAL)
 
         if error:
             self._log_to_ui("="*50)
@@ -187,89 +251,146 @@ class FootPressureApp(tk.Tk):
             self._log_to_ui("="*50)
             self._log_to_ui("분석이 성공적으로 완료되었습니다.")
             self._log_to_ui("="*50)
-            # 결과 이미지 표시
-            self.display_matplotlib_figure(vis_data)
             self.status_label.config(text=f"분석 완료!")
-
-        # 버튼 다시 활성화
-        self.btn_run.config(state=tk.NORMAL)
-        self.btn_browse.config(state=tk.NORMAL)
+            # 결과 이미지는 Tk가 대기 중인 이벤트를 먼저 처리한 뒤 idle 시점에 그립니다.
+            # 그 사이에 새 분석이 완료되면 토큰이 갱신되어 밀린 렌더링은 건너뜁니다.
+            self._pending_draw_token += 1
+            self.after_idle(self._do_draw, self._pending_draw_token, vis_data)
+
+    def _do_draw(self, token, vis_data):
+        """예약된 렌더링 중 가장 최근 것만 실제로 그립니다."""
+        if token != self._pending_draw_token:
+            return  # 이미 더 새로운 결과가 예약됨 - 이 렌더링은 낭비이므로 생략
+        self.display_matplotlib_figure(vis_data)
+
+        # 큰 압력 배열은 AxesImage가 이미 들고 있으므로 dict 쪽 참조는 바로 끊고,
+        # 이전 분석의 아티스트/버퍼가 다음 GC까지 수십 MB를 붙들지 않도록 즉시 수거합니다
+        vis_data['pressure_data'] = None
+        gc.collect()
+
+    def _on_canvas_resize(self, event):
+        """캔버스 크기가 바뀌면 캡처해 둔 배경/레이아웃이 무효화되므로 다시 계산하게 합니다."""
+        self._bg = None
+        self._layout_done = False
+
+    def _on_resize(self, event):
+        """<Configure>마다 다시 그리지 않고 드래그가 멈춘 뒤 한 번만 처리합니다."""
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(80, self._do_resize)
+
+    def _do_resize(self):
+        """드래그가 멈춘 시점에 한 번만 레이아웃/배경을 다시 계산하고 그립니다."""
+        self._resize_after = None
+        self._bg = None
+        self._layout_done = False
+        self.canvas.draw_idle()
 
     def display_matplotlib_figure(self, vis_data):
         """Matplotlib Figure를 Tkinter Canvas에 그립니다."""
         try:
-            self.ax.clear()
-            
-            # 스레드에서 전달받은 리스트를 시각화를 위해 다시 Numpy 배열로 변환
-            pressure_data_np = np.array(vis_data['pressure_data'])
-            
-            # 시각화 함수에 전달할 데이터 복사본 생성
-            vis_data_for_drawing = vis_data.copy()
-            vis_data_for_drawing['pressure_data'] = pressure_data_np
-
-            self.ax.imshow(pressure_data_np, cmap=VISUALIZATION['CMAP'], interpolation='nearest')
-            
-            # 공통 시각화 로직 호출 (Numpy 배열이 포함된 데이터 전달)
-            self._draw_details_on_ax(self.ax, vis_data_for_drawing)
-
-            self.ax.set_title('Foot Pressure Analysis Report', fontproperties=FONT_PROP)
-            self.ax.axis('off')
-            
-            self.fig.tight_layout(pad=0)
-            
-            self.canvas.draw()
-            
+            # 엔진이 ndarray를 그대로 넘겨주므로 리스트→배열 변환/복사가 필요 없습니다
+            pressure_data_np = vis_data['pressure_data']
+
+            if self._im is None or self._bg is None:
+                # 전체 경로: 축을 새로 구성하고 정적 배경(제목/여백)을 캡처
+                self.ax.clear()
+                self._detail_artists = []
+                self.ax.set_title('Foot Pressure Analysis Report', fontproperties=FONT_PROP)
+                self.ax.axis('off')
+                # 배경을 캡처하기 전에 이미지를 먼저 만들어야 draw()의 apply_aspect가
+                # equal-aspect 축 박스를 보정합니다. 빈 축에서 캡처하면 이후 블릿이
+                # 보정되지 않은 박스에 그려져 이미지가 가로로 늘어납니다.
+                self._im = self.ax.imshow(pressure_data_np, cmap=VISUALIZATION['CMAP'],
+                                          interpolation='nearest')
+                # 레이아웃 제약 풀이는 비싸므로 창 크기가 바뀌지 않았다면 재사용합니다
+                if not self._layout_done:
+                    self.fig.tight_layout(pad=0)
+                    self._layout_done = True
+                # 정적 배경에 이미지 자체가 들어가면 안 되므로 캡처하는 동안만 숨깁니다
+                self._im.set_visible(False)
+                self.canvas.draw()
+                self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+                self._im.set_visible(True)
+            else:
+                # 블리팅 경로: AxesImage를 재사용해 데이터만 교체하고 이전 동적 아티스트를 제거
+                # (ax.clear + 새 imshow는 컬러맵/정규화 상태를 매번 다시 만들게 됨)
+                for artist in self._detail_artists:
+                    artist.remove()
+                if self._im.get_array().shape != pressure_data_np.shape:
+                    # 센서 geometry가 달라져도 이미지 아티스트는 유지하고 범위만 갱신
+                    rows, cols = pressure_data_np.shape
+                    self._im.set_extent((-0.5, cols - 0.5, rows - 0.5, -0.5))
+                    self.ax.set_xlim(-0.5, cols - 0.5)
+                    self.ax.set_ylim(rows - 0.5, -0.5)
+                self._im.set_data(pressure_data_np)
+                self._im.autoscale()
+
+            # 공통 시각화 로직 호출 (전체 딕셔너리 대신 필요한 shape/결과만 전달)
+            self._detail_artists = self._draw_details_on_ax(
+                self.ax, pressure_data_np.shape, vis_data.get('analysis_results', {}))
+
+            # 캡처한 배경 위에 변경된 아티스트만 그려 넣고 블릿
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self._im)
+            for artist in self._detail_artists:
+                self.ax.draw_artist(artist)
+            self.canvas.blit(self.fig.bbox)
+
         except Exception as e:
             self._log_to_ui(f"이미지 표시 오류: {e}")
             messagebox.showerror("이미지 표시 오류", f"결과 이미지를 표시하는 데 실패했습니다:\n{e}")
 
-    def _draw_details_on_ax(self, ax, vis_data):
-        """주어진 Matplotlib ax에 분석 결과를 그립니다."""
-        rows, cols = vis_data['pressure_data'].shape
+    def _draw_details_on_ax(self, ax, pressure_shape, results):
+        """주어진 Matplotlib ax에 분석 결과를 그리고, 생성한 아티스트 목록을 반환합니다."""
+        rows, cols = pressure_shape
         mid_col = cols // 2
-        
-        results = vis_data.get('analysis_results', {})
+
+        artists = []
         final_bbox = results.get('final_bbox')
         distribution = results.get('distribution', {})
         zones = results.get('zones')
 
         if final_bbox:
             min_r, max_r = final_bbox
-            ax.axhspan(min_r, max_r, facecolor=VISUALIZATION['BBOX_COLOR'], alpha=VISUALIZATION['BBOX_ALPHA'])
-            
+            artists.append(ax.axhspan(min_r, max_r, facecolor=VISUALIZATION['BBOX_COLOR'], alpha=VISUALIZATION['BBOX_ALPHA']))
+
             if zones:
                 # 구역선 그리기
                 hind_end_y = zones['mid']['start'] - 0.5
                 mid_end_y = zones['fore']['start'] - 0.5
-                ax.axhline(y=hind_end_y, xmin=0.05, xmax=0.95, color=VISUALIZATION['LINE_COLOR'], linestyle='--', linewidth=1)
-                ax.axhline(y=mid_end_y, xmin=0.05, xmax=0.95, color=VISUALIZATION['LINE_COLOR'], linestyle='--', linewidth=1)
+                artists.append(ax.axhline(y=hind_end_y, xmin=0.05, xmax=0.95, color=VISUALIZATION['LINE_COLOR'], linestyle='--', linewidth=1))
+                artists.append(ax.axhline(y=mid_end_y, xmin=0.05, xmax=0.95, color=VISUALIZATION['LINE_COLOR'], linestyle='--', linewidth=1))
 
                 # 압력 분포 텍스트 (구역에 맞춰 위치 조정)
                 if distribution:
-                    text_props = {'color': VISUALIZATION['FONT_COLOR_DIST'], 'fontsize': VISUALIZATION['FONT_SIZE_DIST'], 
-                                       'ha': 'center', 'va': 'center', 'fontproperties': FONT_PROP}
-                    
                     y_hind = (zones['hind']['start'] + zones['hind']['stop']) / 2
                     y_mid = (zones['mid']['start'] + zones['mid']['stop']) / 2
                     y_fore = (zones['fore']['start'] + zones['fore']['stop']) / 2
 
-                    ax.text(mid_col * 0.5, y_hind, f"뒤: {distribution.get('LH', 0):.1f}%", **text_props)
-                    ax.text(mid_col * 0.5, y_mid, f"중간: {distribution.get('LM', 0):.1f}%", **text_props)
-                    ax.text(mid_col * 0.5, y_fore, f"앞: {distribution.get('LF', 0):.1f}%", **text_props)
-
-                    ax.text(mid_col * 1.5, y_hind, f"뒤: {distribution.get('RH', 0):.1f}%", **text_props)
-                    ax.text(mid_col * 1.5, y_mid, f"중간: {distribution.get('RM', 0):.1f}%", **text_props)
-                    ax.text(mid_col * 1.5, y_fore, f"앞: {distribution.get('RF', 0):.1f}%", **text_props)
+                    # (x, y, 문자열)을 먼저 만들어 두고 한 루프로 그립니다
+                    x_left, x_right = mid_col * 0.5, mid_col * 1.5
+                    labels = [
+                        (x_left, y_hind, f"뒤: {distribution.get('LH', 0):.1f}%"),
+                        (x_left, y_mid, f"중간: {distribution.get('LM', 0):.1f}%"),
+                        (x_left, y_fore, f"앞: {distribution.get('LF', 0):.1f}%"),
+                        (x_right, y_hind, f"뒤: {distribution.get('RH', 0):.1f}%"),
+                        (x_right, y_mid, f"중간: {distribution.get('RM', 0):.1f}%"),
+                        (x_right, y_fore, f"앞: {distribution.get('RF', 0):.1f}%"),
+                    ]
+                    for x, y, s in labels:
+                        artists.append(ax.text(x, y, s, **_TEXT_PROPS_DIST))
 
         foot_types = results.get('foot_types', {})
         if foot_types:
-            text_props_type = {'color': VISUALIZATION['FONT_COLOR_TYPE'], 'fontsize': VISUALIZATION['FONT_SIZE_TYPE'], 'ha': 'center', 'weight': 'bold', 'fontproperties': FONT_PROP}
             left_info = foot_types.get('left')
             if left_info and left_info['type'] not in ["데이터 없음", "데이터 부족"]:
-                ax.text(mid_col / 2, rows * 0.05, f"{left_info['type']}\n(AI: {left_info['value']:.2f})", **text_props_type)
+                artists.append(ax.text(mid_col / 2, rows * 0.05, f"{left_info['type']}\n(AI: {left_info['value']:.2f})", **_TEXT_PROPS_TYPE))
             right_info = foot_types.get('right')
             if right_info and right_info['type'] not in ["데이터 없음", "데이터 부족"]:
-                ax.text(mid_col * 1.5, rows * 0.05, f"{right_info['type']}\n(AI: {right_info['value']:.2f})", **text_props_type)
+                artists.append(ax.text(mid_col * 1.5, rows * 0.05, f"{right_info['type']}\n(AI: {right_info['value']:.2f})", **_TEXT_PROPS_TYPE))
+
+        return artists
 
 if __name__ == "__main__":
     app = FootPressureApp()
@@ -1,11 +1,12 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk
 import os
-import glob
+import threading
 from datetime import datetime
 
-class PodoAnalysisApp(tk.Tk):
+from _gui_base import LoggingTkMixin
+
+class PodoAnalysisApp(LoggingTkMixin, tk.Tk):
     """
     족저압 분석 GUI 애플리케이션
     요구사항에 맞춘 단순한 인터페이스 제공
@@ -24,6 +25,12 @@ class PodoAnalysisApp(tk.Tk):
             # 입력 경로 저장
             self.input_path = ""
             self.current_image = None
+            # (경로, mtime, 크기)별 썸네일 캐시 - 같은 리포트 재클릭 시 디코드/리사이즈 생략
+            self._photo_cache = {}
+            # (리포트 폴더, 파일명)별 최신 리포트 캐시 - 폴더 mtime이 그대로면 재탐색 생략
+            self._report_cache = {}
+            self._last_report_path = None  # 리사이즈 후 다시 썸네일할 현재 리포트
+            self._resize_after = None      # 리사이즈 디바운스용 after 핸들
             print("변수 초기화 완료")
             
             # UI 위젯 생성
@@ -89,6 +96,8 @@ class PodoAnalysisApp(tk.Tk):
         # 이미지 표시 프레임
         self.image_frame = tk.Frame(main_frame, bg="lightgray", relief=tk.SUNKEN, bd=2)
         self.image_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+        # 드래그 중 매 <Configure>마다 리샘플링하지 않도록 디바운스합니다
+        self.image_frame.bind("<Configure>", self._on_frame_resize)
         
         # 이미지 라벨 (초기에는 빈 상태)
         self.image_label = tk.Label(
@@ -103,13 +112,8 @@ class PodoAnalysisApp(tk.Tk):
         log_frame = tk.LabelFrame(main_frame, text="로그", padx=10, pady=10)
         log_frame.pack(fill=tk.X)
         
-        # 로그 텍스트
-        self.log_text = tk.Text(log_frame, height=5, wrap=tk.WORD, state=tk.DISABLED)
-        log_scrollbar = tk.Scrollbar(log_frame, command=self.log_text.yview)
-        self.log_text.config(yscrollcommand=log_scrollbar.set)
-        
-        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # 로그 텍스트 (공유 믹스인)
+        self._create_log_widgets(log_frame, height=5)
     
     def _log_message(self, message):
         """로그 메시지를 출력합니다."""
@@ -117,10 +121,7 @@ class PodoAnalysisApp(tk.Tk):
         log_entry = f"[{timestamp}] {message}"
         
         # UI 로그에 추가
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, log_entry + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._append_log_lines(log_entry + "\n")
         
         # 터미널에도 출력 [[memory:4703375]]
         print(log_entry)
@@ -188,51 +189,133 @@ class PodoAnalysisApp(tk.Tk):
         if not os.path.exists(reports_dir):
             self._log_message(f"분석 리포트 폴더를 찾을 수 없습니다: {reports_dir}")
             return None
-        
+
+        # 폴더 mtime이 그대로면 이전 탐색 결과를 그대로 반환합니다
+        # (클릭마다 glob + 파일별 stat을 반복하지 않음)
+        dir_mtime = os.stat(reports_dir).st_mtime_ns
+        cache_key = (reports_dir, base_name)
+        cached = self._report_cache.get(cache_key)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+
         # 해당 파일명으로 시작하는 리포트 이미지 찾기
-        pattern = os.path.join(reports_dir, f"{base_name}_*_report.png")
-        matching_files = glob.glob(pattern)
-        
-        if matching_files:
+        # (scandir의 DirEntry는 stat 결과를 캐시하므로 glob + 파일별 getctime보다 syscall이 절반)
+        prefix = f"{base_name}_"
+        best = None
+        with os.scandir(reports_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith("_report.png"):
+                    ctime = entry.stat().st_ctime
+                    if best is None or ctime > best[0]:
+                        best = (ctime, entry.path)
+
+        if best:
             # 가장 최근 파일 선택 (파일명에 날짜/시간이 포함되어 있으므로)
-            latest_file = max(matching_files, key=os.path.getctime)
+            latest_file = best[1]
             self._log_message(f"분석 리포트 이미지를 찾았습니다: {os.path.basename(latest_file)}")
+            self._report_cache[cache_key] = (dir_mtime, latest_file)
             return latest_file
         else:
-            self._log_message(f"패턴에 맞는 파일이 없습니다: {pattern}")
+            self._log_message(f"패턴에 맞는 파일이 없습니다: {prefix}*_report.png")
+            self._report_cache[cache_key] = (dir_mtime, None)
             return None
     
+    def _on_frame_resize(self, event):
+        """<Configure>마다 재썸네일하지 않고 드래그가 멈춘 뒤 한 번만 갱신합니다."""
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(80, self._refresh_after_resize)
+
+    def _refresh_after_resize(self):
+        """드래그가 멈춘 시점에 현재 리포트를 새 프레임 크기에 맞춰 다시 표시합니다."""
+        self._resize_after = None
+        if self._last_report_path:
+            self._display_analysis_image(self._last_report_path)
+
     def _display_analysis_image(self, image_path):
-        """분석 결과 이미지를 UI에 표시합니다."""
+        """분석 결과 이미지를 UI에 표시합니다. 디코드/리사이즈는 워커 스레드에서 수행합니다."""
+        self._last_report_path = image_path
+
+        # 이미지 크기를 프레임에 맞게 조정 (아직 배치 전이면 기본값 사용)
+        frame_width = self.image_frame.winfo_width()
+        frame_height = self.image_frame.winfo_height()
+        if frame_width <= 1 or frame_height <= 1:
+            frame_width, frame_height = 600, 400
+
+        try:
+            # 같은 리포트를 다시 표시할 때는 디코드+리사이즈를 건너뜁니다
+            cache_key = (image_path, os.path.getmtime(image_path), frame_width, frame_height)
+        except OSError as e:
+            self._show_image_error(e)
+            return
+
+        photo = self._photo_cache.get(cache_key)
+        if photo is not None:
+            self.current_image = photo
+            self.image_label.config(image=photo, text="")
+            self._log_message("이미지가 성공적으로 표시되었습니다.")
+            return
+
+        # PNG 디코드가 UI 스레드를 막지 않도록 백그라운드에서 처리
+        thread = threading.Thread(
+            target=self._load_image_worker,
+            args=(image_path, cache_key, (frame_width, frame_height))
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _load_image_worker(self, image_path, cache_key, frame_size):
+        """워커 스레드: PNG 디코드와 리사이즈만 수행하고 UI 갱신은 메인 스레드로 넘깁니다."""
+        # PIL은 첫 이미지 표시 시점에만 import (창이 뜨기 전 cold-start 비용 제거)
+        from PIL import Image
+
         try:
-            # PIL로 이미지 로드
             pil_image = Image.open(image_path)
-            
-            # 이미지 크기를 프레임에 맞게 조정
-            frame_width = 600
-            frame_height = 400
-            
+            pil_image.load()
+
             # 비율을 유지하면서 크기 조정
-            pil_image.thumbnail((frame_width, frame_height), Image.Resampling.LANCZOS)
-            
-            # Tkinter에서 사용할 수 있는 형태로 변환
-            self.current_image = ImageTk.PhotoImage(pil_image)
-            
+            # (미리보기 용도에는 LANCZOS 8탭 필터 대신 BILINEAR로 충분히 깨끗함)
+            if pil_image.width > frame_size[0] or pil_image.height > frame_size[1]:
+                pil_image.thumbnail(frame_size, Image.Resampling.BILINEAR)
+
+            self.after(0, self._finish_display, pil_image, cache_key)
+        except Exception as e:
+            self.after(0, self._show_image_error, e)
+
+    def _finish_display(self, pil_image, cache_key):
+        """메인 스레드: Tk 객체 생성(PhotoImage)과 라벨 갱신만 수행합니다."""
+        from PIL import ImageTk
+
+        try:
+            # Tkinter에서 사용할 수 있는 형태로 변환 (Tk 객체는 메인 스레드에서만 생성)
+            photo = ImageTk.PhotoImage(pil_image)
+            self._photo_cache.clear()  # 미리보기는 마지막 1장만 유지
+            self._photo_cache[cache_key] = photo
+
+            # 이전 PhotoImage 참조를 먼저 끊어 PIL/Tk 버퍼가 바로 해제되도록 합니다
+            self.current_image = None
+            self.current_image = photo
+
             # 이미지 라벨 업데이트
             self.image_label.config(
                 image=self.current_image,
                 text=""  # 텍스트 제거
             )
-            
+
             self._log_message("이미지가 성공적으로 표시되었습니다.")
-            
         except Exception as e:
-            self._log_message(f"이미지 표시 오류: {str(e)}")
-            messagebox.showerror("오류", f"이미지를 표시하는 중 오류가 발생했습니다:\n{str(e)}")
+            self._show_image_error(e)
+
+    def _show_image_error(self, error):
+        """이미지 표시 실패를 로그와 다이얼로그로 알립니다."""
+        self._log_message(f"이미지 표시 오류: {str(error)}")
+        messagebox.showerror("오류", f"이미지를 표시하는 중 오류가 발생했습니다:\n{str(error)}")
     
     def _clear_image(self):
         """현재 표시된 이미지를 제거합니다."""
         self.current_image = None
+        self._last_report_path = None
         self.image_label.config(
             image="",
             text="분석 결과가 여기에 표시됩니다"
@@ -1,20 +1,106 @@
 import sys
 import os
-import glob
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QMessageBox, QTextEdit,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QTableView, QHeaderView
 )
 from PySide6.QtPrintSupport import QPrinter, QPrintDialog
-from PySide6.QtGui import QPixmap, QFont, QPainter
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QFont, QPainter, QImage
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QTimer,
+    QThreadPool, QRunnable, QObject, Signal
+)
 
 # 실시간 분석을 위한 모듈 추가
 from analyzer_engine import FootPressureAnalyzer
 import numpy as np
 
+class ResultsModel(QAbstractTableModel):
+    """
+    결과 테이블용 모델.
+    QTableWidgetItem을 셀마다 생성하는 대신 문자열 배열만 들고 있다가
+    data()에서 돌려주므로, 갱신 비용이 셀 수에 비례해 커지지 않습니다.
+    """
+    HEADERS = ["항목", "왼쪽 발", "오른쪽 발"]
+    ROW_LABELS = ["상태", "아치 지수 (AI)", "뒤 압력 (%)", "중간 압력 (%)", "앞 압력 (%)"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = np.empty((5, 3), dtype=object)
+        self._data[:, 0] = self.ROW_LABELS
+        self._data[:, 1:] = "-"
+
+    def rowCount(self, parent=QModelIndex()):
+        return self._data.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return self._data.shape[1]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable  # 편집만 불가 (선택/복사는 유지)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._data[index.row(), index.column()]
+        if role == Qt.TextAlignmentRole and index.column() > 0:
+            return Qt.AlignCenter
+        return None
+
+# 버튼 스타일시트는 내용이 고정이므로 모듈 상수로 한 번만 만들어 둡니다
+_BTN_STYLE_GREEN = "background-color: #4CAF50; color: white; padding: 10px 20px;"
+_BTN_STYLE_BLUE = "background-color: #2196F3; color: white; padding: 10px 20px;"
+_BTN_STYLE_RED = "background-color: #f44336; color: white; padding: 10px 20px;"
+_BTN_STYLE_GREY = "background-color: #607D8B; color: white; padding: 10px 20px;"
+
+class _AnalyzeSignals(QObject):
+    """워커 → 메인 스레드 통지용 시그널 묶음 (QRunnable은 QObject가 아니므로 분리)."""
+    finished = Signal(object, str)  # (vis_data, output_path)
+    failed = Signal(str)
+    log = Signal(str)
+
+class _AnalyzeTask(QRunnable):
+    """워커 스레드에서 파싱/분석/렌더링/PNG 저장까지 수행하는 작업."""
+    def __init__(self, input_path):
+        super().__init__()
+        self.input_path = input_path
+        self.signals = _AnalyzeSignals()
+
+    def run(self):
+        try:
+            analyzer = FootPressureAnalyzer(self.input_path, ui_logger=self.signals.log.emit)
+            if not analyzer.run_analysis():
+                self.signals.failed.emit(analyzer.error_message or "알 수 없는 오류 발생")
+                return
+
+            vis_data = analyzer.get_visualization_data()
+            if not vis_data:
+                self.signals.failed.emit("시각화 데이터를 생성할 수 없습니다.")
+                return
+
+            reports_dir = os.path.join(
+                os.path.dirname(os.path.dirname(self.input_path)), 'output', 'analysis_reports')
+            os.makedirs(reports_dir, exist_ok=True)
+
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            input_basename = os.path.splitext(os.path.basename(self.input_path))[0]
+            output_path = os.path.join(reports_dir, f"{input_basename}_{timestamp}_report.png")
+
+            # 렌더링(Agg Figure)과 PNG 저장도 워커에서 수행하고
+            # RGB 버퍼(불투명 보고서라 알파 불필요)를 함께 넘겨
+            # 메인 스레드는 표시만 하게 합니다
+            vis_data['report_rgb'] = analyzer.save_visualization(
+                output_path, vis_data, return_rgb=True)
+            self.signals.finished.emit(vis_data, output_path)
+        except Exception as e:
+            self.signals.failed.emit(f"분석 중 예외가 발생했습니다: {e}")
+
 class PodoAnalysisAppPySide(QWidget):
     """
     족저압 분석 GUI 애플리케이션 (PySide6 기반)
@@ -26,6 +112,11 @@ class PodoAnalysisAppPySide(QWidget):
         
         self.input_path = ""
         self.current_report_path = None # 현재 표시된 리포트 경로 저장
+        self._source_pixmap = None      # 원본 해상도 픽스맵 캐시 (리사이즈 시 재디코드 방지)
+        self._pyramid = []              # 미리 축소해 둔 픽스맵 단계들 (작은 쪽부터)
+        self._resize_timer = QTimer(self)  # 리사이즈가 멈춘 뒤 Smooth 재렌더링용
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._rescale_smooth)
         self._init_ui()
         self._log_message("프로그램이 시작되었습니다.")
     
@@ -42,16 +133,16 @@ class PodoAnalysisAppPySide(QWidget):
         self.btn_analyze = QPushButton("Analyze Podo")
         self.path_label = QLabel("선택된 경로: 없음")
         self.image_label = QLabel("분석 결과가 여기에 표시됩니다")
-        self.results_table = QTableWidget()
+        self.results_table = QTableView()
         self.log_text = QTextEdit()
 
         # --- 컨트롤 버튼 설정 ---
         self.btn_input_path.setFont(QFont("Arial", 12))
-        self.btn_input_path.setStyleSheet("background-color: #4CAF50; color: white; padding: 10px 20px;")
+        self.btn_input_path.setStyleSheet(_BTN_STYLE_GREEN)
         self.btn_input_path.clicked.connect(self.select_input_path)
         
         self.btn_analyze.setFont(QFont("Arial", 12))
-        self.btn_analyze.setStyleSheet("background-color: #2196F3; color: white; padding: 10px 20px;")
+        self.btn_analyze.setStyleSheet(_BTN_STYLE_BLUE)
         self.btn_analyze.clicked.connect(self.analyze_podo)
         
         control_layout.addWidget(self.btn_input_path)
@@ -61,14 +152,14 @@ class PodoAnalysisAppPySide(QWidget):
         # 'Print' 버튼 추가
         self.btn_print = QPushButton("Print")
         self.btn_print.setFont(QFont("Arial", 12))
-        self.btn_print.setStyleSheet("background-color: #f44336; color: white; padding: 10px 20px;")
+        self.btn_print.setStyleSheet(_BTN_STYLE_RED)
         self.btn_print.clicked.connect(self.print_widget)
         control_layout.addWidget(self.btn_print)
 
         # 'Exit' 버튼 추가
         self.btn_exit = QPushButton("Exit")
         self.btn_exit.setFont(QFont("Arial", 12))
-        self.btn_exit.setStyleSheet("background-color: #607D8B; color: white; padding: 10px 20px;")
+        self.btn_exit.setStyleSheet(_BTN_STYLE_GREY)
         self.btn_exit.clicked.connect(self.close)
         control_layout.addWidget(self.btn_exit)
 
@@ -97,70 +188,57 @@ class PodoAnalysisAppPySide(QWidget):
 
     def _setup_results_table(self):
         """결과 테이블의 초기 모양을 설정합니다."""
-        self.results_table.setRowCount(5)
-        self.results_table.setColumnCount(3)
-        
-        self.results_table.setHorizontalHeaderLabels(["항목", "왼쪽 발", "오른쪽 발"])
+        self.results_model = ResultsModel(self)
+        self.results_table.setModel(self.results_model)
         self.results_table.verticalHeader().setVisible(False)
-        
+
         header = self.results_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.Stretch)
-        
-        items = ["상태", "아치 지수 (AI)", "뒤 압력 (%)", "중간 압력 (%)", "앞 압력 (%)"]
-        for i, item_text in enumerate(items):
-            item = QTableWidgetItem(item_text)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.results_table.setItem(i, 0, item)
-        
-        self._clear_results_table()
 
     def _clear_results_table(self):
         """결과 테이블의 데이터 영역을 '-'로 초기화합니다."""
-        for row in range(self.results_table.rowCount()):
-            for col in range(1, self.results_table.columnCount()):
-                self.results_table.setItem(row, col, self._create_table_item("-"))
+        self.results_model._data[:, 1:] = "-"
+        self.results_model.layoutChanged.emit()
 
     def _update_results_table(self, analysis_results):
         """분석 결과를 테이블에 채워 넣습니다."""
         if not analysis_results:
             self._clear_results_table()
             return
-            
+
         foot_types = analysis_results.get('foot_types', {})
         distribution = analysis_results.get('distribution', {})
-        
+
         data_map = {
             '왼쪽': {'col': 1, 'prefix': 'L'},
             '오른쪽': {'col': 2, 'prefix': 'R'}
         }
-        
+
+        data = self.results_model._data
+        vals = np.empty((4, 2))
         for foot_key, foot_info in data_map.items():
             col_idx = foot_info['col']
             prefix = foot_info['prefix']
-            
+
             foot_type_data = foot_types.get(foot_key, {})
-            
-            type_text = foot_type_data.get('type', 'N/A').split(' ')[0]
-            arch_index = foot_type_data.get('value', 0)
-            hind_pressure = distribution.get(f'{prefix}H', 0)
-            mid_pressure = distribution.get(f'{prefix}M', 0)
-            fore_pressure = distribution.get(f'{prefix}F', 0)
-            
-            self.results_table.setItem(0, col_idx, self._create_table_item(type_text))
-            self.results_table.setItem(1, col_idx, self._create_table_item(f"{arch_index:.3f}"))
-            self.results_table.setItem(2, col_idx, self._create_table_item(f"{hind_pressure:.1f}"))
-            self.results_table.setItem(3, col_idx, self._create_table_item(f"{mid_pressure:.1f}"))
-            self.results_table.setItem(4, col_idx, self._create_table_item(f"{fore_pressure:.1f}"))
-
-    def _create_table_item(self, text):
-        """테이블에 들어갈 아이템(셀)을 생성하고 기본 속성을 설정합니다."""
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignCenter)
-        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-        return item
-        
+
+            data[0, col_idx] = foot_type_data.get('type', 'N/A').split(' ')[0]
+            vals[:, col_idx - 1] = (foot_type_data.get('value', 0),
+                                    distribution.get(f'{prefix}H', 0),
+                                    distribution.get(f'{prefix}M', 0),
+                                    distribution.get(f'{prefix}F', 0))
+
+        # 숫자 8개는 f-string 8번 대신 np.char.mod 한 번으로 포매팅합니다
+        # (AI는 소수 3자리, 압력 3종은 1자리)
+        fmt = np.array(['%.3f', '%.1f', '%.1f', '%.1f'])[:, None]
+        data[1:5, 1:3] = np.char.mod(fmt, vals)
+
+        # 셀 단위 setItem 대신 백킹 배열을 바꾼 뒤 변경 영역을 한 번만 알립니다
+        self.results_model.dataChanged.emit(self.results_model.index(0, 1),
+                                            self.results_model.index(4, 2))
+
     def _log_message(self, message):
         if message.startswith("[ENGINE]"):
             log_entry = f"[{datetime.now().strftime('%H:%M:%S')}] {message}"
@@ -198,58 +276,91 @@ class PodoAnalysisAppPySide(QWidget):
             return
             
         self._log_message(f"분석을 시작합니다: {os.path.basename(self.input_path)}")
-        QApplication.setOverrideCursor(Qt.WaitCursor)
 
-        try:
-            analyzer = FootPressureAnalyzer(self.input_path, ui_logger=self._log_message)
-            if not analyzer.run_analysis():
-                QMessageBox.critical(self, "분석 오류", analyzer.error_message or "알 수 없는 오류 발생")
-                return
+        # 무거운 작업은 전역 스레드 풀로 보내 이벤트 루프를 막지 않습니다
+        self.btn_analyze.setEnabled(False)
+        task = _AnalyzeTask(self.input_path)
+        task.signals.log.connect(self._log_message)
+        task.signals.finished.connect(self._on_analysis_done)
+        task.signals.failed.connect(self._on_analysis_failed)
+        QThreadPool.globalInstance().start(task)
 
-            vis_data = analyzer.get_visualization_data()
-            if not vis_data:
-                QMessageBox.warning(self, "경고", "시각화 데이터를 생성할 수 없습니다.")
-                return
+    def _on_analysis_done(self, vis_data, output_path):
+        """워커 완료 시 메인 스레드에서 결과를 반영합니다."""
+        self.btn_analyze.setEnabled(True)
+        self._update_results_table(vis_data.get('analysis_results'))
+        self.current_report_path = output_path
 
-            vis_data['pressure_data'] = np.array(vis_data['pressure_data'])
+        rgb = vis_data.get('report_rgb')
+        if rgb is not None:
+            # 워커가 렌더링한 RGB 버퍼를 그대로 사용 - 저장한 PNG를 다시 디코드하지 않으며
+            # 픽셀당 3바이트라 RGBA 대비 스케일링 시 메모리 이동량이 25% 적습니다
+            h, w = rgb.shape[:2]
+            qimg = QImage(rgb.data, w, h, 3 * w, QImage.Format_RGB888)
+            self._set_source_pixmap(QPixmap.fromImage(qimg))  # fromImage가 깊은 복사
+            self._display_analysis_image()
+            self._log_message("이미지가 성공적으로 표시되었습니다.")
+        else:
+            self._display_analysis_image(output_path)
+        self._log_message(f"분석 완료: {os.path.basename(output_path)}")
 
-            reports_dir = os.path.join(os.path.dirname(os.path.dirname(self.input_path)),'output','analysis_reports')
-            os.makedirs(reports_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            input_basename = os.path.splitext(os.path.basename(self.input_path))[0]
-            output_filename = f"{input_basename}_{timestamp}_report.png"
-            output_path = os.path.join(reports_dir, output_filename)
+    def _on_analysis_failed(self, message):
+        """워커 실패 시 메인 스레드에서 오류를 알립니다."""
+        self.btn_analyze.setEnabled(True)
+        QMessageBox.critical(self, "분석 오류", message)
+        self._log_message(f"오류: {message}")
 
-            analyzer.save_visualization(output_path, vis_data)
-            
-            self._update_results_table(vis_data.get('analysis_results'))
-            self.current_report_path = output_path
-            self._display_analysis_image(output_path)
-            self._log_message(f"분석 완료: {output_filename}")
+    _PYRAMID_WIDTHS = (400, 800, 1600)
 
-        except Exception as e:
-            QMessageBox.critical(self, "치명적 오류", f"분석 중 예외가 발생했습니다: {e}")
-        finally:
-            QApplication.restoreOverrideCursor()
-
-    def _display_analysis_image(self, image_path, is_resize=False):
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            self._log_message(f"이미지 로드 실패: {image_path}")
+    def _set_source_pixmap(self, pixmap):
+        """원본 픽스맵을 교체하고 리사이즈용 축소 피라미드를 미리 만들어 둡니다."""
+        self._source_pixmap = pixmap
+        # 대표 크기 몇 단계를 미리 Smooth로 축소해 두면 이후 리사이즈는
+        # 가장 가까운 단계에서 마무리 스케일만 하면 됩니다 (원본 전체 필터링 회피)
+        self._pyramid = [pixmap.scaledToWidth(w, Qt.SmoothTransformation)
+                         for w in self._PYRAMID_WIDTHS if w < pixmap.width()]
+
+    def _display_analysis_image(self, image_path=None, fast=False):
+        """캐시된 원본 픽스맵을 라벨 크기에 맞춰 스케일해 표시합니다."""
+        if image_path is not None:
+            # PNG 디코드는 로드 시 한 번만 - 리사이즈 때는 캐시된 원본을 스케일만 합니다
+            pixmap = QPixmap(image_path)
+            if pixmap.isNull():
+                self._source_pixmap = None
+                self._pyramid = []
+                self._log_message(f"이미지 로드 실패: {image_path}")
+                return
+            self._set_source_pixmap(pixmap)
+        if self._source_pixmap is None:
             return
 
-        scaled_pixmap = pixmap.scaled(self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # 목표 크기를 덮는 가장 작은 피라미드 단계에서 스케일 (없으면 원본)
+        target = self.image_label.size()
+        src = self._source_pixmap
+        for level in self._pyramid:
+            if level.width() >= target.width() and level.height() >= target.height():
+                src = level
+                break
+
+        # 드래그 중에는 빠른 필터, 멈춘 뒤 타이머에서 Smooth로 한 번 더 렌더링
+        mode = Qt.FastTransformation if fast else Qt.SmoothTransformation
+        scaled_pixmap = src.scaled(target, Qt.KeepAspectRatio, mode)
         self.image_label.setPixmap(scaled_pixmap)
-        
-        if not is_resize:
-             self._log_message("이미지가 성공적으로 표시되었습니다.")
+
+        if image_path is not None:
+            self._log_message("이미지가 성공적으로 표시되었습니다.")
+
+    def _rescale_smooth(self):
+        """리사이즈가 잦아든 뒤 한 번만 Smooth 필터로 다시 스케일합니다."""
+        self._display_analysis_image()
 
     def _clear_results(self):
         """이미지와 테이블을 모두 초기화합니다."""
         self.image_label.clear()
         self.image_label.setText("분석 결과가 여기에 표시됩니다")
         self.current_report_path = None
+        self._source_pixmap = None
+        self._pyramid = []
         self._clear_results_table()
         self._log_message("이전 분석 결과가 제거되었습니다.")
 
@@ -274,8 +385,10 @@ class PodoAnalysisAppPySide(QWidget):
             self._log_message("인쇄가 취소되었습니다.")
 
     def resizeEvent(self, event):
-        if self.image_label.pixmap() and self.current_report_path:
-            self._display_analysis_image(self.current_report_path, is_resize=True)
+        if self._source_pixmap is not None:
+            # 드래그 중에는 빠른 필터로 즉시 따라가고, 50ms 조용해지면 Smooth로 마무리
+            self._display_analysis_image(fast=True)
+            self._resize_timer.start(50)
         super().resizeEvent(event)
 
 def main():
@@ -2,6 +2,20 @@ import json
 import numpy as np
 import os
 
+# orjson이 있으면 C 레벨 직렬화를 사용합니다 (없으면 stdlib json으로 동작)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# "Row_i" 키 목록은 한 번 만들어 재사용합니다 (호출마다 f-string을 다시 평가하지 않음)
+_ROW_KEYS = []
+
+def _row_keys(n):
+    if len(_ROW_KEYS) < n:
+        _ROW_KEYS.extend(f"Row_{i}" for i in range(len(_ROW_KEYS), n))
+    return _ROW_KEYS[:n]
+
 def create_json_data(pressure_matrix, filename, output_dir):
     """
     Numpy 배열을 받아 족저압 데이터 JSON 형식으로 저장합니다.
@@ -15,14 +29,19 @@ def create_json_data(pressure_matrix, filename, output_dir):
     }
     
     rows, _ = pressure_matrix.shape
-    for i in range(rows):
-        # Numpy 배열의 행을 ", "로 구분된 문자열로 변환
-        row_str = ", ".join(map(str, pressure_matrix[i].astype(int)))
-        data["RawPressureByRows"][f"Row_{i}"] = row_str
-        
+    # 행별 str() 루프 대신 np.char.mod 한 번으로 전체를 문자열화
+    mat_i = pressure_matrix.astype(np.int32, copy=False)
+    rows_str = [", ".join(r) for r in np.char.mod('%d', mat_i).tolist()]
+    data["RawPressureByRows"] = dict(zip(_row_keys(rows), rows_str))
+
     filepath = os.path.join(output_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+    if orjson is not None:
+        # orjson은 C에서 UTF-8 바이트를 바로 쓰므로 stdlib 인코더를 거치지 않습니다
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
     print(f"✅ 테스트 데이터 생성: {filename}")
 
 
@@ -31,7 +50,9 @@ if __name__ == '__main__':
     SENSOR_ROWS = 40
     SENSOR_COLS_TOTAL = 40
     FOOT_COLS = SENSOR_COLS_TOTAL // 2
-    
+    # 레거시 전역 RandomState 대신 PCG64 제너레이터 + 고정 시드 (재현 가능한 데이터)
+    rng = np.random.default_rng(0)
+
     base_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(base_dir)
     # 모든 테스트 케이스는 기본 input 폴더에 저장
@@ -67,14 +88,15 @@ if __name__ == '__main__':
 
     # Case 5: Flat Foot
     matrix = np.zeros((SENSOR_ROWS, SENSOR_COLS_TOTAL))
-    matrix[5:35, 5:15] = np.random.randint(50, 150, size=(30,10)) # Left
-    matrix[5:35, 25:35] = np.random.randint(50, 150, size=(30,10)) # Right
+    both = rng.integers(50, 150, size=(30, 20), dtype=np.int16)  # 양발 몫을 한 번에 생성
+    matrix[5:35, 5:15] = both[:, :10] # Left
+    matrix[5:35, 25:35] = both[:, 10:] # Right
     create_json_data(matrix, "adv_test_05_flat_foot.json", output_dir)
 
     # Case 6: Diagonal Pressure
     matrix = np.zeros((SENSOR_ROWS, SENSOR_COLS_TOTAL))
-    for i in range(20):
-        matrix[i+5, i] = 150 # Left Diagonal
+    diag = np.arange(20)
+    matrix[diag + 5, diag] = 150 # Left Diagonal (팬시 인덱싱으로 한 번에 기록)
     matrix[10:30, 25:35] = 100 # Right Normal
     create_json_data(matrix, "adv_test_06_diagonal_pressure.json", output_dir)
 
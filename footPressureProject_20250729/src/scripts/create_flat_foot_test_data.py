@@ -2,47 +2,82 @@ import json
 import numpy as np
 import os
 
+# orjson이 있으면 C 레벨 직렬화를 사용합니다 (없으면 stdlib json으로 동작)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# "Row_i" 키 목록은 한 번 만들어 재사용합니다 (호출마다 f-string을 다시 평가하지 않음)
+_ROW_KEYS = []
+
+def _row_keys(n):
+    if len(_ROW_KEYS) < n:
+        _ROW_KEYS.extend(f"Row_{i}" for i in range(len(_ROW_KEYS), n))
+    return _ROW_KEYS[:n]
+
+# (rows, cols)별 ogrid 캐시 - 블롭을 만들 때마다 좌표 배열을 다시 만들지 않습니다
+_OGRID_CACHE = {}
+
+def _get_ogrid(rows, cols):
+    grid = _OGRID_CACHE.get((rows, cols))
+    if grid is None:
+        grid = np.ogrid[:rows, :cols]
+        _OGRID_CACHE[(rows, cols)] = grid
+    return grid
+
 def create_json_data(pressure_matrix, filename, output_dir):
     """Numpy 배열을 받아 족저압 데이터 JSON 형식으로 저장합니다."""
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     data = {"FrameCounter": 1, "RawPressureByRows": {}}
     rows, _ = pressure_matrix.shape
-    for i in range(rows):
-        row_str = ", ".join(map(str, pressure_matrix[i].astype(int)))
-        data["RawPressureByRows"][f"Row_{i}"] = row_str
+    # 행별 str() 루프 대신 np.char.mod 한 번으로 전체를 문자열화
+    mat_i = pressure_matrix.astype(np.int32, copy=False)
+    rows_str = [", ".join(r) for r in np.char.mod('%d', mat_i).tolist()]
+    data["RawPressureByRows"] = dict(zip(_row_keys(rows), rows_str))
     filepath = os.path.join(output_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+    if orjson is not None:
+        # orjson은 C에서 UTF-8 바이트를 바로 쓰므로 stdlib 인코더를 거치지 않습니다
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
     print(f"✅ 평발 테스트 데이터 생성: {filename}")
 
-def create_pressure_blob(rows, cols, center_y, center_x, max_pressure=255, size_y=5, size_x=5):
-    """지정된 위치에 가우시안 블롭을 생성합니다."""
-    y, x = np.ogrid[:rows, :cols]
-    gauss = np.exp(-(((y - center_y)**2 / (2 * size_y**2)) + ((x - center_x)**2 / (2 * size_x**2))))
-    blob = gauss * max_pressure
-    return blob.astype(int)
+def create_pressure_blobs(rows, cols, centers_y, centers_x, max_pressures, sizes_y, sizes_x):
+    """
+    여러 가우시안 블롭을 (K, rows, cols) 브로드캐스트 한 번으로 계산해 합칩니다.
+    블롭마다 exp를 따로 돌리는 대신 exp 한 번 + 합산 한 번으로 끝납니다.
+    """
+    y, x = _get_ogrid(rows, cols)
+    cy = np.asarray(centers_y, dtype=float)[:, None, None]
+    cx = np.asarray(centers_x, dtype=float)[:, None, None]
+    amp = np.asarray(max_pressures, dtype=float)[:, None, None]
+    sy = np.asarray(sizes_y, dtype=float)[:, None, None]
+    sx = np.asarray(sizes_x, dtype=float)[:, None, None]
+    gauss = np.exp(-(((y[None] - cy)**2 / (2 * sy**2)) + ((x[None] - cx)**2 / (2 * sx**2))))
+    # 기존 출력과 동일하도록 블롭별로 정수 절사한 뒤 합산
+    return (gauss * amp).astype(int).sum(axis=0)
 
 def create_flat_foot_shape(is_left=True, severity='mild'):
     """
     평발 형태의 압력 데이터를 생성합니다.
     severity: 'mild' 또는 'severe'
     """
-    matrix = np.zeros((SENSOR_ROWS, FOOT_COLS))
     heel_x = 10
-    
-    # 1. 뒤꿈치
-    matrix += create_pressure_blob(SENSOR_ROWS, FOOT_COLS, center_y=7, center_x=heel_x, max_pressure=180, size_y=5, size_x=5)
-    
-    # 2. 중간발 (평발의 핵심)
-    midfoot_pressure = 200 if severity == 'severe' else 150
+    midfoot_pressure = 200 if severity == 'severe' else 150  # 중간발 (평발의 핵심)
     midfoot_size_x = 6 if severity == 'severe' else 5
-    matrix += create_pressure_blob(SENSOR_ROWS, FOOT_COLS, center_y=20, center_x=heel_x, max_pressure=midfoot_pressure, size_y=8, size_x=midfoot_size_x)
 
-    # 3. 앞꿈치/발가락
-    matrix += create_pressure_blob(SENSOR_ROWS, FOOT_COLS, center_y=34, center_x=heel_x, max_pressure=150, size_y=4, size_x=6)
-    
-    return matrix
+    # 뒤꿈치 / 중간발 / 앞꿈치 블롭을 한 번에 계산
+    return create_pressure_blobs(
+        SENSOR_ROWS, FOOT_COLS,
+        centers_y=[7, 20, 34],
+        centers_x=[heel_x, heel_x, heel_x],
+        max_pressures=[180, midfoot_pressure, 150],
+        sizes_y=[5, 8, 4],
+        sizes_x=[5, midfoot_size_x, 6])
 
 if __name__ == '__main__':
     # --- 설정 ---
@@ -2,6 +2,30 @@ import json
 import numpy as np
 import os
 
+# orjson이 있으면 C 레벨 직렬화를 사용합니다 (없으면 stdlib json으로 동작)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# "Row_i" 키 목록은 한 번 만들어 재사용합니다 (호출마다 f-string을 다시 평가하지 않음)
+_ROW_KEYS = []
+
+def _row_keys(n):
+    if len(_ROW_KEYS) < n:
+        _ROW_KEYS.extend(f"Row_{i}" for i in range(len(_ROW_KEYS), n))
+    return _ROW_KEYS[:n]
+
+# (rows, cols)별 ogrid 캐시 - 블롭을 만들 때마다 좌표 배열을 다시 만들지 않습니다
+_OGRID_CACHE = {}
+
+def _get_ogrid(rows, cols):
+    grid = _OGRID_CACHE.get((rows, cols))
+    if grid is None:
+        grid = np.ogrid[:rows, :cols]
+        _OGRID_CACHE[(rows, cols)] = grid
+    return grid
+
 def create_json_data(pressure_matrix, filename, output_dir):
     """
     Numpy 배열을 받아 족저압 데이터 JSON 형식으로 저장합니다.
@@ -15,13 +39,19 @@ def create_json_data(pressure_matrix, filename, output_dir):
     }
     
     rows, _ = pressure_matrix.shape
-    for i in range(rows):
-        row_str = ", ".join(map(str, pressure_matrix[i].astype(int)))
-        data["RawPressureByRows"][f"Row_{i}"] = row_str
-        
+    # 행별 str() 루프 대신 np.char.mod 한 번으로 전체를 문자열화
+    mat_i = pressure_matrix.astype(np.int32, copy=False)
+    rows_str = [", ".join(r) for r in np.char.mod('%d', mat_i).tolist()]
+    data["RawPressureByRows"] = dict(zip(_row_keys(rows), rows_str))
+
     filepath = os.path.join(output_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+    if orjson is not None:
+        # orjson은 C에서 UTF-8 바이트를 바로 쓰므로 stdlib 인코더를 거치지 않습니다
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
     print(f"✅ 현실적인 테스트 데이터 생성: {filename}")
 
 def create_pressure_blob(rows, cols, center_y, center_x, max_pressure=255, size_y=5, size_x=5):
@@ -29,7 +59,7 @@ def create_pressure_blob(rows, cols, center_y, center_x, max_pressure=255, size_
     지정된 위치에 중심이 강하고 주변으로 갈수록 약해지는 
     현실적인 압력 덩어리(가우시안 블롭)를 생성합니다.
     """
-    y, x = np.ogrid[:rows, :cols]
+    y, x = _get_ogrid(rows, cols)
     
     # 가우시안 함수를 사용하여 블롭 생성
     gauss = np.exp(-(((y - center_y)**2 / (2 * size_y**2)) + ((x - center_x)**2 / (2 * size_x**2))))
@@ -1,20 +1,53 @@
 import os
 import json
+import threading
+from functools import lru_cache
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from matplotlib import font_manager
-from scipy.ndimage import label, find_objects, binary_opening, center_of_mass, gaussian_filter
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from scipy.ndimage import label, find_objects, binary_opening, gaussian_filter1d
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from datetime import datetime
 import io
 import base64
 
+# OpenCV는 선택적 의존성입니다. 설치되어 있으면 SIMD 최적화된 모폴로지 연산을 사용하고,
+# 없으면 기존 scipy.ndimage.binary_opening으로 동작합니다.
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    cv2 = None
+    HAS_CV2 = False
+
+# cc3d도 선택적 의존성입니다. 설치되어 있으면 scipy.ndimage.label보다 빠른
+# 단일 패스 연결 요소 레이블링을 사용합니다.
+try:
+    import cc3d
+    HAS_CC3D = True
+except ImportError:
+    cc3d = None
+    HAS_CC3D = False
+
+# fpng_py가 있으면 렌더링된 픽셀 버퍼를 zlib 기반 경로보다 훨씬 빠른
+# fpng 인코더로 바로 PNG로 만듭니다.
+try:
+    import fpng_py
+    HAS_FPNG = True
+except ImportError:
+    fpng_py = None
+    HAS_FPNG = False
+
 try:
     from .config import ANALYSIS_PARAMS, FOOT_TYPE_CRITERIA, VISUALIZATION
+    from .analyzer_kernels import NUMBA_AVAILABLE, threshold_and_open, side_row_sums
 except ImportError:
     from config import ANALYSIS_PARAMS, FOOT_TYPE_CRITERIA, VISUALIZATION
+    from analyzer_kernels import NUMBA_AVAILABLE, threshold_and_open, side_row_sums
 
 def setup_matplotlib_font():
     """
@@ -37,6 +70,44 @@ def setup_matplotlib_font():
         print(f"❗️ [Font Setup] 폰트 설정 중 오류 발생: {e}")
 
 
+# 보고서용 Figure는 생성/해제 비용(폰트 캐시 조회, 축 구성)이 커서
+# 프로세스당 하나를 만들어 요청 간에 재사용합니다.
+# matplotlib은 스레드 안전하지 않으므로 사용 구간 전체를 락으로 보호합니다.
+_FIG_LOCK = threading.Lock()
+_FIG = None
+_AX_MAIN = None
+_CAX = None
+
+def _get_report_figure(figsize):
+    """재사용 가능한 (Figure, 메인 축, 컬러바 축)을 반환합니다. 호출 전 _FIG_LOCK을 잡아야 합니다."""
+    global _FIG, _AX_MAIN, _CAX
+    if _FIG is None:
+        # pyplot을 거치지 않는 순수 Agg Figure라 pyplot 전역 상태나 close 관리가 필요 없습니다.
+        # 캔버스가 처음부터 출력 해상도로 렌더링하도록 dpi를 고정합니다
+        _FIG = Figure(figsize=figsize, dpi=VISUALIZATION.get('dpi', 150), facecolor='white')
+        FigureCanvasAgg(_FIG)
+        _AX_MAIN = _FIG.add_axes([0.05, 0.1, 0.9, 0.85])
+        _CAX = _FIG.add_axes([0.05, 0.05, 0.9, 0.03])
+    else:
+        _FIG.set_size_inches(*figsize)
+        _AX_MAIN.cla()
+        _CAX.cla()
+    return _FIG, _AX_MAIN, _CAX
+
+
+@lru_cache(maxsize=8)
+def _shape_context(rows, cols):
+    """
+    센서 형태별로 재사용하는 인덱스 벡터/구조 요소 묶음을 반환합니다.
+    센서 형태는 사실상 고정이므로 요청마다 arange/커널을 다시 만들지 않습니다.
+    """
+    row_idx = np.arange(rows, dtype=np.float64)
+    col_idx = np.arange(cols, dtype=np.float64)
+    structure = np.ones((3, 3), dtype=int)
+    cv2_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3)) if HAS_CV2 else None
+    return row_idx, col_idx, structure, cv2_kernel
+
+
 def convert_numpy_to_native(data):
     if isinstance(data, dict):
         return {key: convert_numpy_to_native(value) for key, value in data.items()}
@@ -58,8 +129,9 @@ class FootPressureAnalyzer:
         self.ui_logger = ui_logger
         self.pressure_array = np.array([])
         self.cleaned_array = np.array([])
-        self.left_foot = np.array([])
-        self.right_foot = np.array([])
+        self.smoothed_array = np.array([])
+        self.foot_side = None  # 0=배경, 1=왼발, 2=오른발 (uint8)
+        self._foot_csums = {}  # 발별 행 합 누적 배열 (분포/유형 계산에서 공유)
         self.distribution = {}
         self.foot_types = {}
         self.final_bbox = None
@@ -107,8 +179,17 @@ class FootPressureAnalyzer:
                 return
             
             sorted_keys = sorted(pressure_rows.keys(), key=lambda x: int(x.split('_')[1]))
-            pressure_matrix = [list(map(int, pressure_rows[key].split(', '))) for key in sorted_keys]
-            self.pressure_array = np.array(pressure_matrix)
+
+            # 행 문자열을 C 레벨에서 바로 파싱하여 미리 할당된 버퍼에 채웁니다.
+            # (파이썬 int() 호출 수천 번 + 중간 리스트 생성 제거)
+            # 센서 압력 값은 int16 범위로 충분하며, 셀당 2바이트라
+            # 이후 모든 배열 연산의 메모리 트래픽이 절반이 됩니다.
+            first_row = np.fromstring(pressure_rows[sorted_keys[0]], dtype=np.int16, sep=',')
+            out = np.empty((len(sorted_keys), first_row.shape[0]), dtype=np.int16)
+            out[0] = first_row
+            for i, key in enumerate(sorted_keys[1:], start=1):
+                out[i] = np.fromstring(pressure_rows[key], dtype=np.int16, sep=',')
+            self.pressure_array = out
             self.pressure_data = self.pressure_array.copy()
         except (ValueError, TypeError, KeyError) as e:
             self._log(f"❗️ 오류: '{self.filename}' 데이터 처리 중 오류 발생 - {e}")
@@ -120,6 +201,7 @@ class FootPressureAnalyzer:
         
         vis_data = {
             "pressure_data": self.cleaned_array,
+            "smoothed_data": self.smoothed_array,
             "analysis_results": self.analysis_results,
             "config": {
                 "figsize": VISUALIZATION.get('figsize', (8, 10)),
@@ -134,82 +216,139 @@ class FootPressureAnalyzer:
         if not vis_data:
             return None
 
-        pressure_data = np.array(vis_data['pressure_data'])
-        smoothed_data = gaussian_filter(pressure_data, sigma=VISUALIZATION.get('gaussian_sigma', 1.0))
+        # 스무딩 결과는 _filter_noise에서 한 번만 계산되어 vis_data에 실려 옵니다
+        smoothed_data = np.asarray(vis_data['smoothed_data'])
         
         figsize = vis_data['config'].get('figsize', (8, 10))
         cmap = VISUALIZATION.get('cmap', 'plasma')
         interpolation = VISUALIZATION.get('interpolation', 'bilinear')
         
-        fig = plt.figure(figsize=figsize, facecolor='white')
-        ax_main = fig.add_axes([0.05, 0.1, 0.9, 0.85])
-        cax = fig.add_axes([0.05, 0.05, 0.9, 0.03])
+        # 요청마다 Figure를 새로 만들지 않고 프로세스 단위 캐시를 재사용합니다.
+        with _FIG_LOCK:
+            fig, ax_main, cax = _get_report_figure(figsize)
 
-        im = ax_main.imshow(smoothed_data, cmap=cmap, interpolation=interpolation)
-        self._draw_visualization_details(fig, ax_main, vis_data)
-        ax_main.axis('off')
+            im = ax_main.imshow(smoothed_data, cmap=cmap, interpolation=interpolation)
+            self._draw_visualization_details(fig, ax_main, vis_data)
+            ax_main.axis('off')
 
-        cbar = fig.colorbar(im, cax=cax, orientation='horizontal')
-        cbar.set_label('Pressure', size=10)
-        cbar.ax.tick_params(labelsize=8)
-        
-        try:
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=VISUALIZATION.get('dpi', 150), bbox_inches='tight', pad_inches=0.1)
-            buf.seek(0)
-            return base64.b64encode(buf.read()).decode('utf-8')
-        except Exception as e:
-            self._log(f"❗️ Base64 인코딩 실패: {e}")
-            return None
-        finally:
-            plt.close(fig)
+            cbar = fig.colorbar(im, cax=cax, orientation='horizontal')
+            cbar.set_label('Pressure', size=10)
+            cbar.ax.tick_params(labelsize=8)
+
+            try:
+                if HAS_FPNG:
+                    # savefig(matplotlib → zlib) 대신 렌더링된 RGBA 버퍼를
+                    # fpng로 바로 인코딩합니다 (인코딩이 이 엔드포인트의 최대 비용)
+                    fig.canvas.draw()
+                    rgba = np.asarray(fig.canvas.buffer_rgba())
+                    h, w = rgba.shape[:2]
+                    png_bytes = fpng_py.fpng_encode_image_to_memory(rgba.tobytes(), w, h, 4)
+                    return base64.b64encode(png_bytes).decode('utf-8')
+
+                buf = io.BytesIO()
+                # bbox_inches='tight'는 bbox 측정을 위해 Figure를 한 번 더 렌더링하므로 사용하지 않습니다
+                # (축 배치는 add_axes로 이미 전체 영역을 차지하도록 고정되어 있습니다).
+                # compress_level=1: 웹 전송용 일회성 이미지라 인코딩 속도가 압축률보다 중요합니다.
+                fig.savefig(buf, format='png', dpi=VISUALIZATION.get('dpi', 150),
+                            pil_kwargs={'compress_level': 1}, metadata={})
+                buf.seek(0)
+                return base64.b64encode(buf.read()).decode('utf-8')
+            except Exception as e:
+                self._log(f"❗️ Base64 인코딩 실패: {e}")
+                return None
 
     def _filter_noise(self):
         if self.pressure_array.size == 0: return
         max_pressure = np.max(self.pressure_array)
+        threshold = ANALYSIS_PARAMS.get('noise_threshold', 5)
+
+        # 연결된 작은 객체들(노이즈)을 제거하기 위해 3x3 열림(opening) 연산 사용
         if max_pressure == 0:
             self.cleaned_array = self.pressure_array.copy()
-            return
-            
-        threshold = ANALYSIS_PARAMS.get('noise_threshold', 5)
-        self.cleaned_array = np.where(self.pressure_array > threshold, self.pressure_array, 0)
-        
-        structure = np.ones((3, 3), dtype=int)
-        self.cleaned_array = binary_opening(self.cleaned_array > 0, structure=structure).astype(int) * self.cleaned_array
+        elif NUMBA_AVAILABLE:
+            # 융합 커널: 임계값 + 열림을 중간 배열 없이 한 번에 처리
+            self.cleaned_array = threshold_and_open(self.pressure_array, threshold)
+        else:
+            self.cleaned_array = np.where(self.pressure_array > threshold, self.pressure_array, 0)
+            _, _, structure, cv2_kernel = _shape_context(*self.pressure_array.shape)
+            if HAS_CV2:
+                # OpenCV의 분리형(erode+dilate) 모폴로지는 작은 커널에서 scipy보다 훨씬 빠릅니다.
+                mask = (self.cleaned_array > 0).astype(np.uint8)
+                opened = cv2.morphologyEx(mask, cv2.MORPH_OPEN, cv2_kernel)
+                self.cleaned_array = self.cleaned_array * opened
+            else:
+                self.cleaned_array = binary_opening(self.cleaned_array > 0, structure=structure).astype(int) * self.cleaned_array
+
+        # 시각화용 가우시안 스무딩은 분석 단계에서 한 번만 계산해 둡니다.
+        # float32로 대역폭을 절반으로 줄이고, 분리형 1D 필터 2회로
+        # 범용 N-D 디스패치를 피합니다.
+        sigma = VISUALIZATION.get('gaussian_sigma', 1.0)
+        arr32 = self.cleaned_array.astype(np.float32)
+        if HAS_CV2:
+            self.smoothed_array = cv2.GaussianBlur(arr32, (0, 0), sigma)
+        else:
+            self.smoothed_array = gaussian_filter1d(
+                gaussian_filter1d(arr32, sigma, axis=0), sigma, axis=1)
         
     def _calculate_cop(self):
-        if self.cleaned_array.size == 0 or np.sum(self.cleaned_array) == 0:
+        if self.cleaned_array.size == 0:
+            self.cop = None
+            return
+        # scipy center_of_mass의 범용 레이블 디스패치 대신
+        # 축 합 2회로 1차 모멘트를 직접 계산합니다
+        arr = self.cleaned_array
+        row_mass = arr.sum(axis=1, dtype=np.float64)
+        total = row_mass.sum()
+        if total == 0:
             self.cop = None
             return
-        self.cop = center_of_mass(self.cleaned_array)
+        rows, cols = arr.shape
+        row_idx, col_idx, _, _ = _shape_context(rows, cols)
+        cop_y = (row_mass * row_idx).sum() / total
+        cop_x = (arr.sum(axis=0, dtype=np.float64) * col_idx).sum() / total
+        self.cop = (cop_y, cop_x)
 
     def _separate_feet(self, array):
+        """
+        발 구분 배열(side)을 반환합니다: 0=배경, 1=왼발, 2=오른발.
+        발별 압력 배열을 따로 만들지 않고 uint8 마스크 하나만 할당합니다.
+        압력이 전혀 없으면 None을 반환합니다.
+        """
         if np.sum(array) == 0:
-            return np.array([]), np.array([])
+            return None
         rows, cols = array.shape
         mid_col = cols // 2
-        labeled_array, num_features = label(array > 0)
+        if HAS_CC3D:
+            # scipy.ndimage.label의 기본 구조 요소와 동일한 결과가 되도록 4-연결성을 사용합니다
+            labeled_array, num_features = cc3d.connected_components(
+                array > 0, connectivity=4, return_N=True)
+        else:
+            labeled_array, num_features = label(array > 0)
         if num_features == 1:
             obj_slice = find_objects(labeled_array)[0]
             obj_min_col, obj_max_col = obj_slice[1].start, obj_slice[1].stop
             
             if (obj_min_col < mid_col < obj_max_col) and ((obj_max_col - obj_min_col) > cols / 3):
-                left_mask = np.zeros_like(array, dtype=bool)
-                left_mask[:, :mid_col] = labeled_array[:, :mid_col] == 1
-                right_mask = np.zeros_like(array, dtype=bool)
-                right_mask[:, mid_col:] = labeled_array[:, mid_col:] == 1
-                left_foot, right_foot = array * left_mask, array * right_mask
-                if np.sum(left_foot) > 0 and np.sum(right_foot) > 0:
-                    return left_foot, right_foot
-        left_mask = np.zeros_like(array, dtype=bool)
-        right_mask = np.zeros_like(array, dtype=bool)
-        coms = [center_of_mass(array, labeled_array, i + 1) for i in range(num_features)]
-        for i, com in enumerate(coms):
-            if com[1] < mid_col:
-                left_mask[labeled_array == i + 1] = True
-            else:
-                right_mask[labeled_array == i + 1] = True
-        return array * left_mask, array * right_mask
+                # 하나로 붙은 객체를 중앙 기준으로 강제 분리
+                side = np.zeros(array.shape, dtype=np.uint8)
+                side[:, :mid_col] = labeled_array[:, :mid_col] == 1
+                side[:, mid_col:] = (labeled_array[:, mid_col:] == 1).view(np.uint8) * 2
+                if (side == 1).any() and (side == 2).any():
+                    return side
+        # 객체별 center_of_mass 호출(객체 수만큼 전체 배열 스캔) 대신
+        # bincount 두 번으로 모든 객체의 x 무게중심을 한 번에 계산합니다.
+        flat_lbl = labeled_array.ravel()
+        flat_val = array.ravel().astype(np.float64)
+        col_idx = np.broadcast_to(_shape_context(rows, cols)[1], array.shape).ravel()
+        mass = np.bincount(flat_lbl, weights=flat_val, minlength=num_features + 1)
+        mass_x = np.bincount(flat_lbl, weights=flat_val * col_idx, minlength=num_features + 1)
+        com_x = mass_x[1:] / mass[1:]
+
+        # 배경 0, 모든 객체를 일단 오른발(2)로 두고 왼쪽 객체만 1로 바꿉니다
+        labels = np.arange(1, num_features + 1)
+        side = (labeled_array > 0).view(np.uint8) * 2
+        side[np.isin(labeled_array, labels[com_x < mid_col])] = 1
+        return side
 
     def _get_foot_zone_indices(self, foot_bbox, total_rows):
         if not foot_bbox: return None
@@ -223,31 +362,47 @@ class FootPressureAnalyzer:
         return {'hind': {'start': min_r, 'stop': hind_end}, 'mid': {'start': hind_end, 'stop': mid_end}, 'fore': {'start': mid_end, 'stop': max_r + 1}}
 
     def _calculate_pressure_distribution(self):
-        self.left_foot, self.right_foot = self._separate_feet(self.cleaned_array)
-        def get_virtual_footprint(foot_array):
-            if np.sum(foot_array) == 0: return None
-            rows_with_pressure = np.where(np.any(foot_array > 0, axis=1))[0]
-            return (rows_with_pressure.min(), rows_with_pressure.max()) if len(rows_with_pressure) > 0 else None
-        left_bbox, right_bbox = get_virtual_footprint(self.left_foot), get_virtual_footprint(self.right_foot)
+        self.foot_side = self._separate_feet(self.cleaned_array)
+        if self.foot_side is None: return
+        # 발별 전체 배열을 만드는 대신 side 마스크 기반 행 합 + 누적 합만 계산합니다.
+        # 누적 합은 _analyze_foot_type에서도 재사용되므로 인스턴스에 보관합니다.
+        bboxes = {}
+        if NUMBA_AVAILABLE:
+            # 융합 커널: 양발의 행 합을 매트릭스 1회 순회로 동시에 계산
+            left_rows, right_rows = side_row_sums(self.cleaned_array, self.foot_side)
+            row_sums_by_foot = {'L': left_rows, 'R': right_rows}
+        else:
+            row_sums_by_foot = {
+                prefix: self.cleaned_array.sum(
+                    axis=1, where=(self.foot_side == side_id), dtype=np.int64)
+                for prefix, side_id in (('L', 1), ('R', 2))}
+        for prefix, row_sums in row_sums_by_foot.items():
+            self._foot_csums[prefix] = np.concatenate(([0], row_sums.cumsum()))
+            rows_with_pressure = np.flatnonzero(row_sums)
+            bboxes[prefix] = (rows_with_pressure[0], rows_with_pressure[-1]) if rows_with_pressure.size else None
+        left_bbox, right_bbox = bboxes['L'], bboxes['R']
         if not left_bbox and not right_bbox: return
         all_min_r = min(b[0] for b in [left_bbox, right_bbox] if b)
         all_max_r = max(b[1] for b in [left_bbox, right_bbox] if b)
         self.final_bbox = (all_min_r, all_max_r)
-        if (total_pressure := np.sum(self.left_foot) + np.sum(self.right_foot)) == 0: return
+        if (total_pressure := int(self._foot_csums['L'][-1] + self._foot_csums['R'][-1])) == 0: return
         if not (zones := self._get_foot_zone_indices(self.final_bbox, self.pressure_array.shape[0])): return
-        for prefix, foot_array in [('L', self.left_foot), ('R', self.right_foot)]:
-            if (foot_total := np.sum(foot_array)) == 0: continue
+        for prefix in ('L', 'R'):
+            # 누적 합 덕분에 각 구역 합계는 O(1) 뺄셈입니다
+            csum = self._foot_csums[prefix]
+            if (foot_total := int(csum[-1])) == 0: continue
             for zone_name, idx in zones.items():
-                self.distribution[f"{prefix}{zone_name[0].upper()}"] = (np.sum(foot_array[idx['start']:idx['stop'], :]) / foot_total) * 100
+                zone_total = csum[idx['stop']] - csum[idx['start']]
+                self.distribution[f"{prefix}{zone_name[0].upper()}"] = (zone_total / foot_total) * 100
 
     def _analyze_foot_type(self):
         if not (zones := self._get_foot_zone_indices(self.final_bbox, self.pressure_array.shape[0])): return
         for prefix, name in [('L', '왼쪽'), ('R', '오른쪽')]:
-            foot_array = self.left_foot if prefix == 'L' else self.right_foot
-            if (foot_total := np.sum(foot_array)) == 0:
+            csum = self._foot_csums.get(prefix)
+            if csum is None or (foot_total := int(csum[-1])) == 0:
                 self.foot_types[name] = {'type': "데이터 없음", 'value': 0, 'score': 0}
                 continue
-            mid_pressure = np.sum(foot_array[zones['mid']['start']:zones['mid']['stop'], :])
+            mid_pressure = csum[zones['mid']['stop']] - csum[zones['mid']['start']]
             arch_index = mid_pressure / foot_total
             self.foot_types[name] = {'type': self._classify_arch(arch_index), 'value': arch_index, 'score': self._calculate_arch_score(arch_index)}
 
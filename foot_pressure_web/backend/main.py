@@ -1,18 +1,20 @@
 import uvicorn
-import json
+import orjson
 import traceback
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 import logging
-from logging.handlers import RotatingFileHandler  # (추가) 파일 로깅을 위해 import
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from queue import Queue
 import time
 import os
 from contextlib import asynccontextmanager
 
 from analyzer_engine import (
-    FootPressureAnalyzer, 
-    setup_matplotlib_font,
-    convert_numpy_to_native
+    FootPressureAnalyzer,
+    setup_matplotlib_font
 )
 
 # --- (수정) 파일 로거 설정 ---
@@ -39,24 +41,34 @@ file_handler.setLevel(logging.DEBUG)
 formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 file_handler.setFormatter(formatter)
 
+# 요청 경로에서 디스크 쓰기를 하지 않도록 로그 레코드는 큐에만 넣고,
+# 실제 파일 쓰기(file_handler)는 백그라운드 리스너 스레드가 수행합니다.
+log_queue = Queue(-1)
+queue_handler = QueueHandler(log_queue)
+log_listener = QueueListener(log_queue, file_handler)
+
 # 핸들러를 로거에 추가
-logger.addHandler(file_handler)
+logger.addHandler(queue_handler)
 
 # FastAPI와 uvicorn 로거에도 핸들러를 추가하여 모든 로그를 파일로 보냅니다.
-logging.getLogger("fastapi").addHandler(file_handler)
-logging.getLogger("uvicorn").addHandler(file_handler)
-logging.getLogger("uvicorn.access").addHandler(file_handler)
-logging.getLogger("uvicorn.error").addHandler(file_handler)
+logging.getLogger("fastapi").addHandler(queue_handler)
+logging.getLogger("uvicorn").addHandler(queue_handler)
+logging.getLogger("uvicorn.access").addHandler(queue_handler)
+logging.getLogger("uvicorn.error").addHandler(queue_handler)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    log_listener.start()
     logger.info("Server is starting up...")
     setup_matplotlib_font()
     yield
     logger.info("Server is shutting down...")
+    log_listener.stop()  # 큐에 남은 레코드를 파일에 모두 쓰고 종료
 
-app = FastAPI(lifespan=lifespan)
+# ORJSONResponse: 응답 직렬화를 C 레벨에서 한 번에 수행하며
+# OPT_SERIALIZE_NUMPY로 numpy 스칼라/배열도 파이썬 변환 없이 처리합니다.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS 설정
 app.add_middleware(
@@ -82,14 +94,16 @@ async def analyze_pressure_data(file: UploadFile = File(...)):
             raise HTTPException(status_code=400, detail="잘못된 파일 타입입니다. .json 파일을 업로드해주세요.")
 
         try:
-            contents = await file.read()
-            json_data = json.loads(contents.decode('utf-8'))
+            # orjson은 bytes를 바로 받으므로 업로드 버퍼 외에 디코드된 str 사본을 만들지 않습니다
+            json_data = orjson.loads(await file.read())
         finally:
             await file.close()
 
         analyzer = FootPressureAnalyzer(json_data=json_data, filename=file.filename)
-        
-        if not analyzer.run_analysis():
+
+        # CPU 바운드 분석/렌더링을 이벤트 루프에서 내리고 스레드풀에서 실행합니다.
+        # numpy/scipy C 코드는 GIL을 놓으므로 요청들이 실제로 병렬 처리됩니다.
+        if not await run_in_threadpool(analyzer.run_analysis):
             error_msg = analyzer.error_message or "알 수 없는 분석 오류가 발생했습니다."
             raise HTTPException(status_code=500, detail=error_msg)
 
@@ -97,12 +111,15 @@ async def analyze_pressure_data(file: UploadFile = File(...)):
         if not vis_data:
             raise HTTPException(status_code=500, detail="시각화 데이터 생성에 실패했습니다.")
         
-        image_base64 = analyzer.get_visualization_as_base64(vis_data)
+        image_base64 = await run_in_threadpool(analyzer.get_visualization_as_base64, vis_data)
         if not image_base64:
             raise HTTPException(status_code=500, detail="시각화 이미지 생성에 실패했습니다.")
 
         logger.info(f"[{request_id}] Sending successful response.")
-        return convert_numpy_to_native({
+        # Response 인스턴스를 직접 반환해야 jsonable_encoder를 건너뛰고
+        # ORJSONResponse.render(OPT_SERIALIZE_NUMPY)가 numpy 값을 C에서 직렬화합니다.
+        # (dict를 반환하면 jsonable_encoder가 먼저 돌면서 numpy 스칼라에서 ValueError)
+        return ORJSONResponse({
             "analysis_results": vis_data.get('analysis_results'),
             "image_base64": image_base64
         })
@@ -0,0 +1,54 @@
+"""
+/analyze 엔드포인트 회귀 테스트.
+
+정상적인 업로드가 200과 전체 분석 결과를 돌려주는지 확인합니다.
+(numpy 값 직렬화가 깨지면 엔드포인트 전체가 500을 돌려주므로,
+직렬화 경로를 바꿀 때는 반드시 이 테스트를 통과해야 합니다.)
+
+실행: foot_pressure_web/backend 디렉토리에서 `python -m pytest -q`
+"""
+import numpy as np
+import orjson
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+def _make_upload(rows=40, cols=40):
+    """양발 압력이 있는 정상 센서 데이터 JSON 바이트를 생성합니다."""
+    rng = np.random.default_rng(0)
+    matrix = np.zeros((rows, cols), dtype=np.int16)
+    matrix[5:35, 5:15] = rng.integers(20, 150, size=(30, 10))    # 왼발
+    matrix[5:35, 25:35] = rng.integers(20, 150, size=(30, 10))   # 오른발
+    return orjson.dumps({
+        "FrameCounter": 1,
+        "RawPressureByRows": {
+            f"Row_{i}": ", ".join(map(str, matrix[i])) for i in range(rows)
+        },
+    })
+
+
+def test_analyze_valid_upload_returns_200():
+    with TestClient(app) as client:
+        response = client.post(
+            "/analyze",
+            files={"file": ("test.json", _make_upload(), "application/json")})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["image_base64"]
+
+    results = body["analysis_results"]
+    # numpy 스칼라가 섞이는 키들이 모두 직렬화되어 돌아와야 합니다
+    assert len(results["final_bbox"]) == 2
+    assert set(results["zones"]) == {"hind", "mid", "fore"}
+    assert set(results["distribution"]) == {"LH", "LM", "LF", "RH", "RM", "RF"}
+    assert set(results["foot_types"]) == {"왼쪽", "오른쪽"}
+    assert len(results["cop"]) == 2
+
+
+def test_analyze_rejects_non_json_filename():
+    with TestClient(app) as client:
+        response = client.post(
+            "/analyze", files={"file": ("data.txt", b"{}", "text/plain")})
+    assert response.status_code == 400